@@ -0,0 +1,73 @@
+"""Player-vs-platforms query cost: linear check_collision scan vs CollisionWorld,
+plus one swept-AABB move per query."""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from kobalt.engine import CollisionWorld
+from kobalt.widgets import Widget
+
+WORLD = (20_000, 2_000)
+COUNTS = [10, 100, 1_000, 10_000]
+QUERIES = 200
+
+
+def make_platforms(count):
+    rng = random.Random(count)
+    return [
+        Widget(WORLD, rng.randrange(WORLD[0]), rng.randrange(WORLD[1]), 120, 30)
+        for _ in range(count)
+    ]
+
+
+def main():
+    probe = Widget(WORLD, 0, 0, 40, 40)
+    rng = random.Random(0)
+    points = [
+        (rng.randrange(WORLD[0]), rng.randrange(WORLD[1])) for _ in range(QUERIES)
+    ]
+    print(
+        f"{'platforms':>10} {'scan us':>10} {'world us':>10} "
+        f"{'sweep us':>10} {'pairs ms':>10}"
+    )
+    for count in COUNTS:
+        platforms = make_platforms(count)
+
+        start = time.perf_counter()
+        for x, y in points:
+            probe.set_position(x, y)
+            [p for p in platforms if probe.check_collision(p)]
+        scan = (time.perf_counter() - start) / QUERIES * 1e6
+
+        world = CollisionWorld(cell_size=128)
+        world.add(*platforms)
+        world.add(probe)
+        start = time.perf_counter()
+        for x, y in points:
+            probe.set_position(x, y)
+            world.collisions(probe)
+        indexed = (time.perf_counter() - start) / QUERIES * 1e6
+
+        start = time.perf_counter()
+        for x, y in points:
+            probe.set_position(x, y)
+            # an air-strafe-fast diagonal step
+            world.sweep(probe, 60, 45)
+        sweep = (time.perf_counter() - start) / QUERIES * 1e6
+
+        start = time.perf_counter()
+        world.pairs()
+        pairs = (time.perf_counter() - start) * 1000
+        print(
+            f"{count:>10} {scan:>10.1f} {indexed:>10.1f} "
+            f"{sweep:>10.1f} {pairs:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""ParticleEmitter update + draw cost against live particle count."""
+
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+
+from kobalt.widgets import ParticleEmitter
+
+SIZE = (1280, 720)
+COUNTS = [1_000, 5_000, 10_000, 20_000]
+FRAMES = 60
+FRAME_MS = 1000 / 60
+
+
+def bench(count):
+    screen = pygame.display.get_surface()
+    emitter = ParticleEmitter(SIZE, capacity=count, gravity=0.0, seed=0)
+    emitter.emit(
+        SIZE[0] / 2, SIZE[1] / 2, count, speed=(0, 300), lifetime=(1e6, 1e6 + 1)
+    )
+    update = draw = 0.0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        emitter.update(1 / 60)
+        mid = time.perf_counter()
+        emitter.render(screen)
+        end = time.perf_counter()
+        update += mid - start
+        draw += end - mid
+    return len(emitter), update / FRAMES * 1000, draw / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode(SIZE)
+    print(f"{'particles':>10} {'update ms':>10} {'draw ms':>10} {'% of 60fps':>11}")
+    for count in COUNTS:
+        live, update, draw = bench(count)
+        share = (update + draw) / FRAME_MS * 100
+        print(f"{live:>10} {update:>10.3f} {draw:>10.3f} {share:>10.0f}%")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Startup budget: import cost (python -X importtime) and time to first frame.
+
+Every measurement runs in a fresh interpreter; the script exits non-zero
+when anything goes over its budget.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+KOBALT = os.path.join(ROOT, "kobalt")
+
+# (module, directory to import from) -> budget in ms
+IMPORT_BUDGETS_MS = {
+    ("libs.winmode", ROOT): 50,
+    ("kobalt", ROOT): 50,
+    ("analysis.plot_speed", KOBALT): 50,
+    ("widgets", KOBALT): 600,
+}
+
+# entry point -> budget in ms from process launch to the first presented frame
+FIRST_FRAME_BUDGETS_MS = {
+    "kobalt/main.py": 1500,
+    "kobalt/air_strafe_testing.py": 1500,
+    "kobalt/collision_testing.py": 1500,
+    "kobalt/headless.py": 1500,  # whole 60 s synthetic run, it never presents
+}
+
+# stops the game at its first display update and reports the wall clock time
+FIRST_FRAME_HOOK = """
+import os, runpy, sys, time
+import pygame
+
+def _first_frame(*args):
+    print(f"FIRST_FRAME {time.time()}", flush=True)
+    os._exit(0)
+
+pygame.display.update = pygame.display.flip = _first_frame
+sys.argv = [sys.argv[1]] + sys.argv[2:]
+sys.path.insert(0, os.path.dirname(os.path.abspath(sys.argv[0])))
+runpy.run_path(sys.argv[0], run_name="__main__")
+print(f"FIRST_FRAME {time.time()}", flush=True)
+"""
+
+
+def headless_env():
+    env = dict(os.environ)
+    env["SDL_VIDEODRIVER"] = "dummy"
+    env["SDL_AUDIODRIVER"] = "dummy"
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    return env
+
+
+def import_time_ms(module, cwd) -> float:
+    """Cumulative import time of module as reported by -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        env=headless_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"no importtime line for {module}")
+
+
+def first_frame_ms(script) -> float:
+    args = [sys.executable, "-c", FIRST_FRAME_HOOK, script]
+    if script.endswith("headless.py"):
+        args += ["--seconds", "60"]
+    start = time.time()
+    result = subprocess.run(
+        args, cwd=ROOT, env=headless_env(), capture_output=True, text=True, timeout=60
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("FIRST_FRAME "):
+            return (float(line.split()[1]) - start) * 1000
+    raise RuntimeError(f"{script} never reached a frame:\n{result.stderr}")
+
+
+def main() -> int:
+    over = 0
+    print(f"{'import':<40} {'ms':>8} {'budget':>8}")
+    for (module, cwd), budget in IMPORT_BUDGETS_MS.items():
+        ms = import_time_ms(module, cwd)
+        over += ms > budget
+        flag = "  OVER" if ms > budget else ""
+        print(f"{module:<40} {ms:>8.1f} {budget:>8}{flag}")
+
+    print(f"\n{'first frame':<40} {'ms':>8} {'budget':>8}")
+    for script, budget in FIRST_FRAME_BUDGETS_MS.items():
+        ms = first_frame_ms(script)
+        over += ms > budget
+        flag = "  OVER" if ms > budget else ""
+        print(f"{script:<40} {ms:>8.1f} {budget:>8}{flag}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Trail.draw frame time against live track count, per-track vs batched."""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+
+from kobalt.widgets import Trail
+
+SIZE = (1280, 720)
+TRACK_COUNTS = [30, 120, 480, 1920]
+FRAMES = 60
+
+
+def fill(trail: Trail, count: int):
+    now = pygame.time.get_ticks()
+    for i in range(count):
+        trail.buffer.append(
+            (i * 7) % SIZE[0],
+            (i * 3) % SIZE[1],
+            now - i,  # spread ages so alphas differ
+            trail.color,
+            trail.width,
+            trail.height,
+            trail.lifetime,
+            trail.max_alpha,
+            trail.min_alpha,
+        )
+
+
+def bench(count: int, batched: bool) -> float:
+    """Mean frame time in ms for one Trail.draw per frame."""
+    screen = pygame.display.get_surface()
+    trail = Trail(
+        SIZE,
+        width=20,
+        height=20,
+        lifetime=600_000,
+        max_alpha=100,
+        capacity=count + FRAMES + 1,
+        batched=batched,
+    )
+    fill(trail, count)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        trail.draw(screen, 100, 100)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode(SIZE)
+    print(f"{'tracks':>8} {'per-track ms':>14} {'batched ms':>12} {'speedup':>8}")
+    for count in TRACK_COUNTS:
+        slow = bench(count, batched=False)
+        fast = bench(count, batched=True)
+        print(f"{count:>8} {slow:>14.3f} {fast:>12.3f} {slow / fast:>7.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
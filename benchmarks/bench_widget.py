@@ -0,0 +1,71 @@
+"""Widget hot-path cost: setter throughput, moves, resizes and memory per instance."""
+
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from kobalt.widgets import Widget
+
+SIZE = (1280, 720)
+N = 200_000
+INSTANCES = 10_000
+
+
+def per_op_ns(fn, n=N) -> float:
+    start = time.perf_counter_ns()
+    fn(n)
+    return (time.perf_counter_ns() - start) / n
+
+
+def set_xy(n):
+    w = Widget(SIZE, 0, 0, 40, 40)
+    for i in range(n):
+        w.x = i
+        w.y = i
+
+
+def read_rect(n):
+    w = Widget(SIZE, 0, 0, 40, 40)
+    for _ in range(n):
+        w.rect
+
+
+def collide(n):
+    a = Widget(SIZE, 0, 0, 40, 40)
+    b = Widget(SIZE, 20, 20, 40, 40)
+    for _ in range(n):
+        a.check_collision(b)
+
+
+def resize(n):
+    w = Widget(SIZE, 100, 100, 40, 40)
+    sizes = [(1280, 720), (1920, 1080)]
+    for i in range(n):
+        w.update_position(sizes[i & 1])
+
+
+def memory_per_instance() -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    widgets = [Widget(SIZE, i, i, 120, 30) for i in range(INSTANCES)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del widgets
+    return total / INSTANCES
+
+
+def main():
+    print(f"x + y setters       {per_op_ns(set_xy):8.0f} ns / move")
+    print(f"rect property       {per_op_ns(read_rect):8.0f} ns / read")
+    print(f"check_collision     {per_op_ns(collide):8.0f} ns / check")
+    print(f"update_position     {per_op_ns(resize, N // 10):8.0f} ns / resize")
+    print(f"memory              {memory_per_instance():8.0f} B / widget")
+
+
+if __name__ == "__main__":
+    main()
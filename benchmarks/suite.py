@@ -0,0 +1,421 @@
+"""Headless benchmark suite, results saved as JSON for commit-to-commit comparison.
+
+    python benchmarks/suite.py                          # run all, save results
+    python benchmarks/suite.py -k trail -k player       # only matching benchmarks
+    python benchmarks/suite.py --compare benchmarks/results/<old>.json
+
+Metrics are lower-is-better except names ending in `_per_s`. With --compare,
+changes worse than --threshold are flagged and the exit status is 1.
+
+Results go to benchmarks/results/<commit>.json, which is git-ignored: they
+are machine-specific. To check a change, run the suite on the base commit
+to get a baseline file, then run it again on the change with --compare
+pointing at that file (or keep a baseline anywhere with --out).
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+import pygame
+
+from kobalt.engine import AssetManager, CollisionWorld
+from kobalt.widgets import Player, Text, Trail, Widget
+from kobalt.widgets.text import render_text
+from libs.winmode import PygameWindowController, WindowStates
+
+SIZE = (1280, 720)
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+REPEAT = 5
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register fn() -> {metric: value} under name."""
+
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+
+    return register
+
+
+def per_call(fn, n, repeat=REPEAT) -> float:
+    """Median seconds per call of fn over `repeat` runs of n calls."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(n):
+            fn()
+        runs.append((time.perf_counter() - start) / n)
+    return statistics.median(runs)
+
+
+# widgets
+
+
+class FrameClock:
+    """
+    Stand-in for pygame.time.get_ticks that moves one 60 fps frame per
+    tick(), so timed loops see the ages, fades and evictions of a real run
+    however fast they go.
+    """
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self) -> int:
+        return int(self.now)
+
+    def tick(self):
+        self.now += 1000 / 60
+
+
+def steady_trail(lifetime, clock: FrameClock) -> Trail:
+    """Trail holding a full `lifetime` ms of tracks at 60 fps, all ages
+    present. With the clock ticking once per new track, one track expires
+    per track added and the count stays constant while timing."""
+    count = max(1, lifetime * 60 // 1000)
+    trail = Trail(
+        SIZE, width=20, height=20, lifetime=lifetime, max_alpha=100, capacity=count + 2
+    )
+    for i in range(count):
+        trail.buffer.append(
+            (i * 7) % SIZE[0],
+            (i * 3) % SIZE[1],
+            clock() - (count - 1 - i) * 1000 // 60,
+            trail.color,
+            trail.width,
+            trail.height,
+            trail.lifetime,
+            trail.max_alpha,
+            trail.min_alpha,
+        )
+    return trail
+
+
+@benchmark("trail")
+def bench_trail():
+    """update_tracks and draw at varying lifetimes (more live tracks), on a
+    pinned 60 fps clock so tracks fade and expire as in a real run."""
+    screen = pygame.display.get_surface()
+    clock = FrameClock(now=60_000)
+    get_ticks = pygame.time.get_ticks
+    pygame.time.get_ticks = clock
+    results = {}
+    try:
+        for lifetime in (250, 1000, 4000):
+            trail = steady_trail(lifetime, clock)
+
+            def update():
+                clock.tick()
+                trail.update_tracks(100, 100)
+
+            results[f"update_tracks_{lifetime}ms_us"] = 1e6 * per_call(update, 2_000)
+            trail = steady_trail(lifetime, clock)
+
+            def draw():
+                clock.tick()
+                trail.draw(screen, 100, 100)
+
+            results[f"draw_{lifetime}ms_ms"] = 1e3 * per_call(draw, 60)
+            results[f"live_tracks_{lifetime}ms"] = len(trail.tracks)
+    finally:
+        pygame.time.get_ticks = get_ticks
+    return results
+
+
+@benchmark("player")
+def bench_player():
+    """Player._update steps per second, keyboard path and collision path."""
+    player = Player(SIZE, 100, 100)
+    step = 1 / 60
+    results = {
+        "update_steps_per_s": 1 / per_call(lambda: player.update(step), 5_000)
+    }
+
+    world = CollisionWorld()
+    for i in range(200):
+        world.add(Widget(SIZE, (i * 97) % SIZE[0], 400 + (i * 31) % 300, 120, 30))
+    player = Player(SIZE, 100, 100, collision_world=world)
+    results["update_collision_steps_per_s"] = 1 / per_call(
+        lambda: player.update(step), 5_000
+    )
+    return results
+
+
+@benchmark("widget")
+def bench_widget():
+    """Property setter and accessor throughput."""
+    w = Widget(SIZE, 0, 0, 40, 40)
+
+    def set_x():
+        w.x = 10
+
+    def set_size():
+        w.width = 40
+        w.height = 40
+
+    def read_rect():
+        w.rect
+
+    return {
+        "set_x_ns": 1e9 * per_call(set_x, 100_000),
+        "set_width_height_ns": 1e9 * per_call(set_size, 100_000),
+        "set_position_ns": 1e9 * per_call(lambda: w.set_position(5, 5), 100_000),
+        "rect_ns": 1e9 * per_call(read_rect, 100_000),
+    }
+
+
+@benchmark("collision")
+def bench_collision():
+    """One probe against n widgets: linear check_collision scan vs the
+    CollisionWorld broad phase."""
+    probe = Widget(SIZE, 600, 300, 40, 40)
+    results = {}
+    for n in (10, 100, 1_000, 10_000):
+        widgets = [
+            Widget(SIZE, (i * 97) % 20_000, (i * 31) % 2_000, 120, 30)
+            for i in range(n)
+        ]
+        world = CollisionWorld()
+        for w in widgets:
+            world.add(w)
+        world.flush()
+
+        def scan():
+            for w in widgets:
+                probe.check_collision(w)
+
+        calls = max(5, 20_000 // n)
+        results[f"scan_{n}_us"] = 1e6 * per_call(scan, calls)
+        results[f"world_{n}_us"] = 1e6 * per_call(
+            lambda: world.query_rect(probe.rect), calls
+        )
+    return results
+
+
+@benchmark("hud_text")
+def bench_hud_text():
+    """HUD line cost: raw FONT.render, cached render_text and a Text widget."""
+    font = pygame.font.SysFont("Courier", 30)
+    screen = pygame.display.get_surface()
+    values = [f"{v / 10:.2f}" for v in range(100)]
+    text = Text(SIZE, font, x=10, y=10)
+    counter = iter(range(10**9))
+
+    def raw():
+        font.render(values[next(counter) % 100], True, (255, 255, 0))
+
+    def cached():
+        render_text(font, values[next(counter) % 100], True, (255, 255, 0))
+
+    def widget():
+        text.set_text(values[next(counter) % 100])
+        text.render(screen)
+
+    return {
+        "font_render_us": 1e6 * per_call(raw, 2_000),
+        "render_text_us": 1e6 * per_call(cached, 2_000),
+        "text_widget_us": 1e6 * per_call(widget, 2_000),
+    }
+
+
+@benchmark("set_mode")
+def bench_set_mode():
+    """PygameWindowController.set_mode latency per transition."""
+    controller = PygameWindowController(SIZE, WindowStates.WINDOWED_STATELESS)
+    results = {}
+    transitions = [
+        (WindowStates.WINDOWED_STATELESS, WindowStates.FULLSCREEN),
+        (WindowStates.FULLSCREEN, WindowStates.WINDOWED_STATELESS),
+        (WindowStates.WINDOWED_STATELESS, WindowStates.WINDOWED_FULLSCREEN),
+        (WindowStates.WINDOWED_FULLSCREEN, WindowStates.WINDOWED_STATELESS),
+    ]
+    timings = {pair: [] for pair in transitions}
+    for _ in range(10):
+        for pair in transitions:
+            controller.set_mode(pair[0])
+            start = time.perf_counter()
+            controller.set_mode(pair[1])
+            timings[pair].append(time.perf_counter() - start)
+    for (old, new), samples in timings.items():
+        name = f"{WindowStates.get_name(old)}_to_{WindowStates.get_name(new)}"
+        name = name.lower().replace(" ", "_")
+        results[f"{name}_ms"] = 1e3 * statistics.median(samples)
+    # leave a plain window for later benchmarks
+    controller.set_mode(WindowStates.WINDOWED_STATELESS)
+    return results
+
+
+@benchmark("assets")
+def bench_assets():
+    """Asset preload (load, downscale, pack, convert) and sprite blit cost from
+    the converted atlas vs an unconverted image."""
+    assets = AssetManager(os.path.join(ROOT, "kobalt", "assets"))
+    preload_ms = assets.preload()
+    stats = assets.stats()
+    screen = pygame.display.get_surface()
+    converted = pygame.transform.scale(assets.get("player"), (40, 40))
+    raw = pygame.transform.scale(assets.sources["player"], (40, 40))
+
+    def blit(image):
+        return lambda: screen.blit(image, (8, 8))
+
+    return {
+        "preload_ms": preload_ms,
+        "load_ms": stats["load_ms"],
+        "pack_ms": stats["pack_ms"],
+        "convert_ms": stats["convert_ms"],
+        "atlas_kb": stats["atlas_kb"],
+        "blit_converted_us": 1e6 * per_call(blit(converted), 20_000),
+        "blit_unconverted_us": 1e6 * per_call(blit(raw), 20_000),
+    }
+
+
+@benchmark("transition")
+def bench_transition():
+    """Scheduled mode switches: request -> SCREEN_CHANGED latency in frames
+    and ms (leaving FULLSCREEN takes two frames), and display changes made
+    for a burst of requests within one frame."""
+    controller = PygameWindowController(
+        SIZE, WindowStates.WINDOWED_STATELESS, min_interval=0
+    )
+    changes = []
+    controller.add_screen_listener(changes.append)
+
+    def settle(mode):
+        frames = 0
+        start = time.perf_counter()
+        controller.request_mode(mode)
+        while controller.has_pending:
+            controller.apply_pending()
+            frames += 1
+        return frames, time.perf_counter() - start
+
+    results = {}
+    for old, new in [
+        (WindowStates.WINDOWED_STATELESS, WindowStates.FULLSCREEN),
+        (WindowStates.FULLSCREEN, WindowStates.WINDOWED_STATELESS),
+    ]:
+        samples = []
+        for _ in range(10):
+            settle(old)
+            frames, elapsed = settle(new)
+            samples.append(elapsed)
+        name = f"{WindowStates.get_name(old)}_to_{WindowStates.get_name(new)}"
+        name = name.lower().replace(" ", "_")
+        results[f"{name}_frames"] = frames
+        results[f"{name}_ms"] = 1e3 * statistics.median(samples)
+
+    # F11 held / Ctrl+1..5 spammed: ten requests before the frame's apply
+    changes.clear()
+    for mode in WindowStates.all_states * 2:
+        controller.request_mode(mode)
+    while controller.has_pending:
+        controller.apply_pending()
+    results["burst_of_10_display_changes"] = len(changes)
+    controller.set_mode(WindowStates.WINDOWED_STATELESS)
+    pygame.event.clear()
+    return results
+
+
+# results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(names) -> dict:
+    pygame.init()
+    pygame.display.set_mode(SIZE)
+    results = {}
+    for name in names:
+        start = time.perf_counter()
+        results[name] = BENCHMARKS[name]()
+        print(f"{name:<12} done in {time.perf_counter() - start:5.1f} s")
+    pygame.quit()
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(old: dict, new: dict, threshold: float) -> int:
+    """Print old vs new per metric, returns the number of regressions."""
+    regressions = 0
+    print(f"\n{'metric':<56} {old['commit']:>12} {new['commit']:>12} {'change':>8}")
+    for name, metrics in new["results"].items():
+        for metric, value in metrics.items():
+            before = old["results"].get(name, {}).get(metric)
+            if not before:
+                continue
+            change = value / before - 1
+            worse = -change if metric.endswith("_per_s") else change
+            flag = "  REGRESSED" if worse > threshold else ""
+            regressions += bool(flag)
+            print(
+                f"{name + '.' + metric:<56} {before:12.3f} {value:12.3f}"
+                f" {change:+8.1%}{flag}"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-k", action="append", default=[], help="run benchmarks matching this"
+    )
+    parser.add_argument("--out", help="results file (default results/<commit>.json)")
+    parser.add_argument("--compare", metavar="JSON", help="earlier results file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="regression threshold"
+    )
+    args = parser.parse_args()
+
+    names = [n for n in BENCHMARKS if not args.k or any(k in n for k in args.k)]
+    data = run(names)
+
+    for name, metrics in data["results"].items():
+        for metric, value in metrics.items():
+            print(f"{name + '.' + metric:<56} {value:12.3f}")
+
+    out = args.out or os.path.join(RESULTS_DIR, f"{data['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(data, f, indent=2)
+    print(f"\nSaved results to {out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            return 1 if compare(json.load(f), data, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
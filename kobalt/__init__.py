@@ -1 +1,14 @@
-from .widgets import *
+# subpackages (and pygame/numpy behind them) load on first attribute access
+_SUBPACKAGES = (".engine", ".widgets")
+
+
+def __getattr__(name):
+    from importlib import import_module
+
+    for subpackage in _SUBPACKAGES:
+        module = import_module(subpackage, __name__)
+        if hasattr(module, name):
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
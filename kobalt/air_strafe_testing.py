@@ -1,13 +1,35 @@
+import argparse
+import math
 import os
 import sys
+import time
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import pygame
 from analysis.plot_speed import plot_speed
-from widgets import Player, Trail
+from engine import (
+    AssetManager,
+    Bindings,
+    DirtyRenderer,
+    Dispatcher,
+    FixedTimestep,
+    KeyboardInput,
+    Profiler,
+    RecordingInput,
+    TelemetryRecorder,
+)
+from widgets import (
+    Graph,
+    ParticleEmitter,
+    Player,
+    ProfilerOverlay,
+    Text,
+    Trail,
+    get_font,
+)
 
-from libs.winmode import PygameWindowController, WindowStates
+from libs.winmode import PygameWindowController, RenderTarget, WindowStates
 
 # colors
 GREEN = (0, 255, 0)
@@ -16,25 +38,45 @@ BLUE = (0, 0, 255)
 
 SIZE = (1280, 720)
 FPS = 60
+TICK_RATE = 60  # physics ticks per second, independent of FPS
+TELEMETRY_DIR = "telemetry"
+ASSET_DIR = "kobalt/assets"
 
 
-def main():
+def main(record_path=None, trace_path=None):
     pygame.init()
     pygame.mouse.set_visible(False)
 
-    FONT = pygame.font.SysFont("Courier", 30)
+    FONT = get_font("Courier", 30)
 
-    controller = PygameWindowController(SIZE, WindowStates.WINDOWED_STATELESS)
+    # the game always draws on a SIZE canvas, scaled to the window
+    controller = PygameWindowController(
+        SIZE,
+        WindowStates.WINDOWED_STATELESS,
+        render_target=RenderTarget(SIZE, scale_mode="fit"),
+    )
     screen = controller.get_screen()
     clock = pygame.time.Clock()
     running = True
 
     w, h = screen.get_size()
 
+    # every image loaded once into one atlas, re-converted on mode switches
+    assets = AssetManager(ASSET_DIR)
+    assets.preload()
+    controller.add_screen_listener(lambda screen: assets.convert())
+
     # player
-    player_image = pygame.image.load("kobalt/assets/player.png").convert_alpha()
     player_w = 40
     player_h = 40
+    # input: rebindable actions, keys polled once per tick
+    bindings = Bindings()
+    bindings.bind("toggle_graph", pygame.K_g)
+    bindings.bind("toggle_profiler", pygame.K_F3)
+    # record every tick's input when asked, for headless replays
+    input_source = KeyboardInput(bindings)
+    if record_path:
+        input_source = RecordingInput(input_source)
     player = Player(
         screen_size=SIZE,
         x=player_w,
@@ -42,8 +84,16 @@ def main():
         width=player_w,
         height=player_h,
         color=BLUE,
-        image=player_image,
+        input_source=input_source,
     )
+    assets.bind(player, "player")
+
+    # fixed-timestep physics
+    engine = FixedTimestep(TICK_RATE)
+    # only redraw and present what changed
+    renderer = DirtyRenderer(present=controller.present)
+    controller.add_screen_listener(lambda screen: renderer.invalidate())
+    engine.add(player)
 
     # tracker trail
     trail = Trail(
@@ -53,105 +103,245 @@ def main():
         max_alpha=100,
     )
 
-    # keybinds and state display setup
+    # keybinds and state display setup; key labels come from the bindings
     keybinds = [
-        ("P", "Toggle Air Strafing"),
-        ("F11", "Fullscreen"),
-        ("ESC", "Quit"),
-        ("SPACE", "Jump"),
-        ("A/D", "Move Left/Right"),
+        (("toggle_strafe",), "Toggle Air Strafing"),
+        (("toggle_graph",), "Toggle Speed Graph"),
+        (("toggle_profiler",), "Toggle Profiler"),
+        (("fullscreen",), "Fullscreen"),
+        (("quit",), "Quit"),
+        (("jump",), "Jump"),
+        (("left", "right"), "Move Left/Right"),
+    ]
+
+    keybind_texts = [
+        (
+            Text(SIZE, FONT, color=(255, 255, 0)),
+            Text(SIZE, FONT, f": {desc}", color=(200, 200, 200)),
+        )
+        for _, desc in keybinds
+    ]
+    keybind_version = None
+
+    def key_label(actions):
+        # first key of each action, e.g. "LEFT/RIGHT"
+        return "/".join(
+            pygame.key.name(keys[0]).upper()
+            for keys in map(bindings.keys_for, actions)
+            if keys
+        )
+
+    def update_keybind_texts():
+        nonlocal keybind_version
+        if keybind_version == bindings.version:
+            return
+        keybind_version = bindings.version
+        for (actions, _), (key_text, _) in zip(keybinds, keybind_texts):
+            key_text.set_text(key_label(actions))
+
+    # state labels never change, values are re-set every frame (cache hits)
+    strafe_text = Text(SIZE, FONT)
+    ground_text = Text(SIZE, FONT)
+    speed_text = Text(SIZE, FONT, color=(255, 255, 0), glyph_atlas=True)
+    state_texts = [
+        (Text(SIZE, FONT, "Air Strafing"), strafe_text),
+        (Text(SIZE, FONT, "On Ground"), ground_text),
+        (Text(SIZE, FONT, "Speed:"), speed_text),
     ]
 
-    def get_state_lines():
-        return [
-            ("Air Strafing:", player.air_strafe),
-            ("On Ground:", player.on_ground),
-            ("Speed:", round(player.speed, 1)),
-        ]
-
-    speeds = []  # for plotting speed over time
-
-    while running:
-        # events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-                if event.key == pygame.K_p:
-                    player.air_strafe = not player.air_strafe
-                    trail.set_color(GREEN if player.air_strafe else RED)
-                if event.key == pygame.K_F11:
-                    controller.set_mode(
-                        WindowStates.WINDOWED_STATELESS
-                        if controller.is_current_fullscreen_mode()
-                        else WindowStates.FULLSCREEN
-                    )
-                    w, h = screen.get_size()
-                    player.update_position((w, h))
-                # pass only key events to the player
-                player.handle_event(event)
-
-        # drawing / updating
-        dt = clock.tick(FPS) / 1000
-        screen = controller.get_screen()
-        screen.fill((0, 0, 0))
-
-        # tracker trail
-        trail.width, trail.height = player.speed, player.speed
-        trail.draw(screen, player.x + player.width // 2, player.y + player.height // 2)
-
-        # player
-        player.draw(screen, dt)
-        speeds.append(float(player.speed))
+    def update_state_texts():
+        strafe_text.set_text("ON" if player.air_strafe else "OFF")
+        strafe_text.set_color(GREEN if player.air_strafe else RED)
+        ground_text.set_text("YES" if player.on_ground else "NO")
+        ground_text.set_color(GREEN if player.on_ground else RED)
+        speed_text.set_text(round(player.speed, 1))
+
+    # stream player state to disk every tick, for plotting speed over time
+    telemetry_path = os.path.join(TELEMETRY_DIR, time.strftime("%Y%m%d-%H%M%S"))
+    # partial chunks are handed to disk once a second, so a kill loses little
+    telemetry = TelemetryRecorder(
+        telemetry_path, tick_rate=TICK_RATE, flush_every=TICK_RATE
+    )
+    engine.on_tick(lambda dt: telemetry.sample(player))
+
+    # live speed graph under the state HUD, one column per tick
+    speed_graph = Graph(
+        SIZE,
+        x=10,
+        y=120,
+        width=300,
+        height=80,
+        color=(255, 255, 0),
+        max_value=player.max_speed,
+        source=lambda: player.speed,
+    )
+    engine.on_tick(lambda dt: speed_graph.sample())
+
+    # jump dust, landing bursts and strafe sparks
+    particles = ParticleEmitter(SIZE, capacity=10_000, size=4, frame_budget_ms=4)
+    engine.add(particles)
+    was_on_ground = player.on_ground
+
+    def emit_player_effects(dt):
+        nonlocal was_on_ground
+        feet_x = player.x + player.width / 2
+        feet_y = player.y + player.height
+        if player.on_ground and not was_on_ground:
+            particles.emit(
+                feet_x, feet_y, 40, speed=(60, 260), angle=(0, math.pi), size=5
+            )
+        elif was_on_ground and not player.on_ground:
+            particles.emit(
+                feet_x,
+                feet_y,
+                20,
+                speed=(40, 140),
+                angle=(math.pi / 6, 5 * math.pi / 6),
+                color=(160, 160, 160),
+            )
+        if not player.on_ground and player.vel_x and player.speed > player.old_speed:
+            # sparks fly off behind the player while strafe speed builds
+            behind = math.pi if player.vel_x > 0 else 0.0
+            particles.emit(
+                feet_x,
+                player.y + player.height / 2,
+                3,
+                speed=(80, 200),
+                angle=(behind - 0.4, behind + 0.4),
+                lifetime=(0.15, 0.35),
+                size=3,
+                color=GREEN,
+            )
+        was_on_ground = player.on_ground
+
+    engine.on_tick(emit_player_effects)
 
+    # per-phase frame timing, F3 shows it; --trace records from the start
+    profiler = Profiler(enabled=bool(trace_path), tracing=bool(trace_path))
+    profiler_overlay = ProfilerOverlay(SIZE, profiler, get_font("Courier", 18))
+
+    def quit_game(event):
+        nonlocal running
+        running = False
+
+    def toggle_strafe(event):
+        player.air_strafe = not player.air_strafe
+        trail.set_color(GREEN if player.air_strafe else RED)
+
+    def toggle_graph(event):
+        speed_graph.visible = not speed_graph.visible
+
+    # events are routed by type and bound action, no if-chains
+    dispatcher = Dispatcher(bindings)
+    dispatcher.on_event(pygame.QUIT, quit_game)
+    dispatcher.on_action("quit", quit_game)
+    dispatcher.on_action("toggle_strafe", toggle_strafe)
+    dispatcher.on_action("toggle_graph", toggle_graph)
+    dispatcher.on_action("toggle_profiler", lambda event: profiler_overlay.toggle())
+    # queued: applied once per frame, repeats coalesce
+    dispatcher.on_action("fullscreen", lambda event: controller.toggle_fullscreen())
+    # monitor geometry is re-queried only after display changes
+    dispatcher.on_any(controller.handle_display_event)
+    # jump presses are buffered for the next tick
+    dispatcher.on_event(pygame.KEYDOWN, player.handle_event)
+
+    def draw_hud(screen):
         # Draw keybinds in top right, key in yellow, rest in gray
+        update_keybind_texts()
         y_offset = 10
-        for key, desc in keybinds:
-            key_surf = FONT.render(key, True, (255, 255, 0))
-            desc_surf = FONT.render(f": {desc}", True, (200, 200, 200))
-            x = screen.get_width() - (key_surf.get_width() + desc_surf.get_width()) - 10
-            screen.blit(key_surf, (x, y_offset))
-            screen.blit(desc_surf, (x + key_surf.get_width(), y_offset))
-            y_offset += key_surf.get_height() + 2
+        for key_text, desc_text in keybind_texts:
+            x = screen.get_width() - (key_text.width + desc_text.width) - 10
+            key_text.set_position(x, y_offset)
+            desc_text.set_position(x + key_text.width, y_offset)
+            renderer.add(key_text.render(screen))
+            renderer.add(desc_text.render(screen))
+            y_offset += key_text.height + 2
 
         # Draw state values in top left, green/red for bools, yellow for speed
+        update_state_texts()
         y_offset = 10
-        for label, value in get_state_lines():
-            if isinstance(value, bool):
-                label = label.strip(":")
-                color = (0, 255, 0) if value else (255, 0, 0)
-                val_text = "None"
-                if label in ["Air Strafing", "Auto Jump"]:
-                    val_text = "ON" if value else "OFF"
-                elif label == "Strafing":
-                    val_text = "YES" if player.air_strafe else "DISABLED"
-                else:
-                    val_text = "YES" if value else "NO"
-                val_surf = FONT.render(val_text, True, color)
-            elif label == "Speed":
-                color = (255, 255, 0)
-                val_surf = FONT.render(f"{value:.2f}", True, color)
-            else:
-                color = (255, 255, 0)
-                val_surf = FONT.render(str(value), True, color)
-            label_surf = FONT.render(label, True, (255, 255, 255))
-            screen.blit(label_surf, (10, y_offset))
-            screen.blit(val_surf, (10 + label_surf.get_width() + 5, y_offset))
-            y_offset += label_surf.get_height() + 2
-
-        # display update
-        pygame.display.update()
+        for label_text, value_text in state_texts:
+            label_text.set_position(10, y_offset)
+            value_text.set_position(10 + label_text.width + 5, y_offset)
+            renderer.add(label_text.render(screen))
+            renderer.add(value_text.render(screen))
+            y_offset += label_text.height + 2
+
+        # live speed graph
+        speed_graph.y = y_offset + 5
+        renderer.add(speed_graph.render(screen))
+
+        # profiler overlay under the graph
+        profiler_overlay.y = speed_graph.y + speed_graph.height + 10
+        renderer.add(profiler_overlay.render(screen))
+
+    try:
+        while running:
+            profiler.begin_frame()
 
+            # events
+            with profiler.phase("events"):
+                dispatcher.process()
+                # at most one display change per frame, before anything is drawn
+                controller.apply_pending()
+
+            # drawing / updating
+            with profiler.phase("wait"):
+                frame_dt = clock.tick(FPS) / 1000
+            with profiler.phase("physics"):
+                engine.advance(frame_dt)
+            alpha = engine.alpha
+            screen = controller.get_screen()
+            renderer.begin(screen)
+
+            # tracker trail
+            with profiler.phase("trail"):
+                trail.width, trail.height = player.speed, player.speed
+                px, py = player.lerp_position(alpha)
+                renderer.add(
+                    trail.draw(screen, px + player.width // 2, py + player.height // 2)
+                )
+
+            # particles and player
+            with profiler.phase("particles"):
+                renderer.add(particles.render(screen, alpha))
+            with profiler.phase("player"):
+                renderer.add(player.render(screen, alpha))
+
+            with profiler.phase("hud"):
+                draw_hud(screen)
+
+            # display update (dirty rects only)
+            with profiler.phase("present"):
+                renderer.end()
+
+            profiler.end_frame()
+    finally:
+        # the last partial chunk is written even if the loop raised
+        telemetry.close()
     pygame.quit()
 
+    if trace_path:
+        profiler.export_chrome_trace(trace_path)
+        print(f"Saved Chrome trace to {trace_path}")
+
+    if record_path:
+        input_source.save(record_path, TICK_RATE)
+        print(f"Saved replay to {record_path}")
+
     # plot speeds after exiting the game loop
     try:
-        plot_speed(speeds, title="Player Speed over Frames", show=True)
+        # memory-mapped and decimated, so long sessions plot quickly
+        plot_speed(telemetry_path, title="Player Speed over Ticks", show=True)
     except Exception as e:
         print(f"Plot skipped: {e}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", metavar="PATH", help="save a replay of the run")
+    parser.add_argument(
+        "--trace", metavar="PATH", help="profile every frame, save a Chrome trace"
+    )
+    args = parser.parse_args()
+    main(args.record, args.trace)
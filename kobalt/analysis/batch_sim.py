@@ -0,0 +1,248 @@
+"""
+Vectorized Player simulator for parameter sweeps.
+
+Steps N independent players at once with the same per-tick rules as
+`widgets.Player` (no collision world): jump, horizontal movement with
+air-strafe growth/decay, gravity, screen-floor clamp and side wrapping.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# same bit layout as engine.input.ACTION_BITS
+LEFT, RIGHT, JUMP = 1, 2, 4
+
+REFERENCE_FPS = 60
+
+
+def batch_simulate(
+    frames,
+    n: int | None = None,
+    tick_rate: int = 60,
+    screen_size=(1280, 720),
+    width=40,
+    height=40,
+    speed=5,
+    jump_height=8,
+    gravity=0.5,
+    air_strafe=True,
+    air_strafe_grow=None,
+    air_strafe_decay=None,
+    max_speed=None,
+    air_strafe_ground_threshold_ms=100,
+    record=("speed", "x", "y"),
+    stride: int = 1,
+    dtype=np.float32,
+) -> dict:
+    """
+    Simulate players over input frames (one action bitmask per tick).
+
+    - frames: shape (T,) shared by every player, or (T, N) per player
+    - player parameters: scalars or arrays of shape (N,), defaults as in Player
+    - record: which per-tick fields to return ("speed", "x", "y", "vel_y")
+    - stride: keep every stride-th tick only
+    Returns a dict of (ceil(T / stride), N) arrays plus the final state.
+    """
+    frames = np.asarray(frames, dtype=np.int64)
+    params = [
+        speed,
+        jump_height,
+        gravity,
+        air_strafe,
+        air_strafe_grow,
+        air_strafe_decay,
+        max_speed,
+        air_strafe_ground_threshold_ms,
+        width,
+        height,
+    ]
+    if n is None:
+        sizes = [np.size(p) for p in params if p is not None]
+        n = frames.shape[1] if frames.ndim == 2 else max(sizes)
+
+    def column(value, default=None):
+        if value is None:
+            value = default
+        return np.broadcast_to(np.asarray(value, dtype=np.float64), (n,)).copy()
+
+    base_speed = column(speed)
+    max_speed = column(max_speed, base_speed * 2.5)
+    grow = column(air_strafe_grow, (max_speed - base_speed) * 0.01)
+    decay = column(air_strafe_decay, 0.98)
+    jump_height = column(jump_height)
+    gravity = column(gravity)
+    threshold = column(air_strafe_ground_threshold_ms)
+    strafing = np.broadcast_to(np.asarray(air_strafe, dtype=bool), (n,)).copy()
+    w = column(width)
+    h = column(height)
+
+    dt = 1 / tick_rate
+    k = dt * REFERENCE_FPS
+    decay_k = decay**k
+    ground_ms = dt * 1000
+    screen_w, screen_h = screen_size
+
+    # state, initialised like the testbeds: bottom-left, standing
+    cur_speed = base_speed.copy()
+    x = w.copy()
+    y = screen_h - h
+    vel_x = np.zeros(n)
+    vel_y = np.zeros(n)
+    on_ground = np.zeros(n, dtype=bool)
+    time_on_ground = np.zeros(n)
+
+    ticks = frames.shape[0]
+    rows = -(-ticks // stride)
+    out = {name: np.empty((rows, n), dtype=dtype) for name in record}
+
+    for tick in range(ticks):
+        mask = frames[tick]
+
+        # jump (only from the ground)
+        jumping = ((mask & JUMP) != 0) & on_ground
+        vel_y = np.where(jumping, -jump_height, vel_y)
+        on_ground &= ~jumping
+        time_on_ground[jumping] = 0
+
+        # horizontal movement uses the speed from before this tick's strafe
+        dirx = ((mask & RIGHT) != 0).astype(np.int64) - ((mask & LEFT) != 0)
+        vel_x = dirx * cur_speed
+        growing = (dirx != 0) & (time_on_ground < threshold)
+        cur_speed = np.where(
+            strafing,
+            np.where(
+                growing,
+                np.minimum(cur_speed + grow * k, max_speed),
+                np.maximum(cur_speed * decay_k, base_speed),
+            ),
+            base_speed,
+        )
+
+        # gravity and move
+        vel_y = vel_y + gravity * k
+        x = x + vel_x * k
+        y = y + vel_y * k
+
+        # floor clamp and side wrapping
+        below = y + h > screen_h
+        y = np.where(below, screen_h - h, y)
+        vel_y = np.where(below, 0.0, vel_y)
+        on_ground = below
+        x = np.where(x > screen_w, -w, x)
+        x = np.where(x < -w, screen_w, x)
+
+        time_on_ground = np.where(on_ground, time_on_ground + ground_ms, 0.0)
+
+        if tick % stride == 0:
+            current = {"speed": cur_speed, "x": x, "y": y, "vel_y": vel_y}
+            for name in record:
+                out[name][tick // stride] = current[name]
+
+    out["final"] = {
+        "speed": cur_speed,
+        "x": x,
+        "y": y,
+        "vel_x": vel_x,
+        "vel_y": vel_y,
+        "on_ground": on_ground,
+        "time_on_ground_ms": time_on_ground,
+    }
+    return out
+
+
+def parameter_grid(**axes) -> dict:
+    """Cartesian product of parameter axes, flattened to (N,) arrays."""
+    names = list(axes)
+    mesh = np.meshgrid(*(np.asarray(axes[name]) for name in names), indexing="ij")
+    return {name: m.ravel() for name, m in zip(names, mesh)}
+
+
+def check_parity(ticks=3000, tolerance=1e-9) -> float:
+    """
+    Run the scalar Player and batch_simulate on the same input and
+    parameters; raises AssertionError past tolerance, returns the max error.
+    """
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    from engine import FixedTimestep, ReplayInput
+    from headless import synthetic_frames
+    from widgets import Player
+
+    frames = synthetic_frames(ticks / 60)
+    cases = [
+        {},
+        {"air_strafe": False},
+        {"speed": 7, "max_speed": 30, "air_strafe_decay": 0.95},
+        {"air_strafe_grow": 0.3, "air_strafe_ground_threshold_ms": 40},
+        {"gravity": 0.9, "jump_height": 14},
+    ]
+    names = (
+        "jump_height",
+        "gravity",
+        "air_strafe",
+        "air_strafe_grow",
+        "air_strafe_decay",
+        "max_speed",
+        "air_strafe_ground_threshold_ms",
+    )
+    params = {name: [] for name in names + ("speed",)}
+    expected = []
+    for case in cases:
+        player = Player(
+            screen_size=(1280, 720),
+            x=40,
+            y=720 - 40,
+            width=40,
+            height=40,
+            input_source=ReplayInput(frames),
+            **case,
+        )
+        # resolved parameters, defaults included
+        for name in names:
+            params[name].append(getattr(player, name))
+        params["speed"].append(player.old_speed)
+
+        engine = FixedTimestep(60)
+        engine.add(player)
+        rows = []
+        for _ in frames:
+            engine.tick()
+            rows.append((player.speed, player.x, player.y))
+        expected.append(rows)
+
+    result = batch_simulate(frames, n=len(cases), dtype=np.float64, **params)
+    expected = np.asarray(expected)  # (cases, T, 3)
+    error = 0.0
+    for i, name in enumerate(("speed", "x", "y")):
+        error = max(error, float(np.abs(result[name].T - expected[:, :, i]).max()))
+    assert error <= tolerance, f"batch simulator diverged from Player by {error}"
+    return error
+
+
+def main():
+    error = check_parity()
+    print(f"parity with Player: max error {error:.3g}")
+
+    from headless import synthetic_frames
+
+    grid = parameter_grid(
+        air_strafe_grow=np.linspace(0.01, 0.5, 25),
+        air_strafe_decay=np.linspace(0.9, 0.999, 20),
+        max_speed=np.linspace(8, 40, 20),
+    )
+    frames = synthetic_frames(10_000 / 60)
+    start = time.perf_counter()
+    result = batch_simulate(frames, record=("speed",), **grid)
+    elapsed = time.perf_counter() - start
+    n = len(grid["max_speed"])
+    best = int(np.argmax(result["speed"].mean(axis=0)))
+    print(f"{n} players x {len(frames)} ticks in {elapsed:.2f} s")
+    print("fastest mean speed:", {k: round(float(v[best]), 4) for k, v in grid.items()})
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,149 @@
 from __future__ import annotations
 
-from typing import Sequence
+import os
+import sys
+from typing import TYPE_CHECKING, Mapping, Sequence
 
-import matplotlib.pyplot as plt
+if TYPE_CHECKING:
+    import numpy as np
+
+# samples kept per series after decimation (about 2 per horizontal pixel)
+MAX_POINTS = 4000
+
+
+def decimate_minmax(values, max_points: int = MAX_POINTS):
+    """Min/max-preserving decimation.
+
+    Splits values into max_points // 2 buckets and keeps each bucket's min and
+    max sample in their original order, so spikes survive downsampling.
+    Returns (indices, values). Works on memory-mapped arrays without copying
+    more than one pass over the data.
+    """
+    import numpy as np
+
+    values = np.asarray(values)
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n), values
+
+    buckets = max(1, max_points // 2)
+    size = -(-n // buckets)  # ceil
+    full = n // size
+    body = values[: full * size].reshape(full, size)
+    lo = body.argmin(axis=1) + np.arange(full) * size
+    hi = body.argmax(axis=1) + np.arange(full) * size
+    idx = [np.minimum(lo, hi), np.maximum(lo, hi)]
+    if full * size < n:  # last, partial bucket
+        tail = values[full * size :]
+        start = full * size
+        a, b = start + int(tail.argmin()), start + int(tail.argmax())
+        idx = [np.append(idx[0], min(a, b)), np.append(idx[1], max(a, b))]
+    indices = np.column_stack(idx).ravel()
+    return indices, values[indices]
 
 
 def plot_speed(
-    speeds: Sequence[float],
+    speeds: Sequence[float] | np.ndarray | str,
     title: str = "Player Speed",
     show: bool = True,
     save_path: str | None = None,
+    max_points: int = MAX_POINTS,
 ) -> None:
     """Plot player speeds over time with minimal matplotlib code.
 
-    - speeds: a list/sequence of speed samples
+    - speeds: a list/sequence/array of speed samples (memory-mapped arrays are
+      fine) or the path of a telemetry recording
     - title: chart title
     - show: whether to display the chart (blocking)
     - save_path: optional path to save the figure (PNG)
+    - max_points: samples drawn after min/max decimation
     """
-    if not speeds:
+    if isinstance(speeds, str):
+        speeds = _load_recording(speeds)["speed"]
+    if len(speeds) == 0:
         print("No speeds to plot.")
         return
 
-    plt.figure(figsize=(8, 3))
-    plt.plot(speeds, lw=1.5, color="#1f77b4")
-    plt.xlabel("Frame")
-    plt.ylabel("Speed (px/s)")
-    plt.title(title)
-    plt.grid(True, alpha=0.25)
-    plt.tight_layout()
+    plot_series(
+        {"Speed (px/s)": speeds},
+        title=title,
+        show=show,
+        save_path=save_path,
+        max_points=max_points,
+    )
+
+
+def plot_series(
+    series: Mapping[str, Sequence[float] | np.ndarray] | str,
+    title: str = "Player Telemetry",
+    show: bool = True,
+    save_path: str | None = None,
+    max_points: int = MAX_POINTS,
+    fields: Sequence[str] | None = None,
+) -> None:
+    """Plot several series (one subplot each) sharing the frame axis.
+
+    - series: {label: samples} or the path of a telemetry recording
+    - fields: which recording columns to plot (default: all of them)
+    - other arguments as in plot_speed; without show the figure is rendered
+      off-screen with the Agg backend, so it works on headless machines
+    """
+    if isinstance(series, str):
+        series = _load_recording(series)
+    if fields is not None:
+        series = {name: series[name] for name in fields}
+    series = {name: values for name, values in series.items() if len(values)}
+    if not series:
+        print("No series to plot.")
+        return
+
+    if show and _has_display():
+        # matplotlib is slow to import, only pay for it when plotting
+        import matplotlib.pyplot as plt
+
+        fig = plt.figure(figsize=(8, 2 + 1.5 * len(series)))
+    else:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        show = False
+        fig = Figure(figsize=(8, 2 + 1.5 * len(series)))
+        FigureCanvasAgg(fig)
+
+    axes = fig.subplots(len(series), 1, sharex=True, squeeze=False)[:, 0]
+    for ax, (name, values) in zip(axes, series.items()):
+        x, y = decimate_minmax(values, max_points)
+        ax.plot(x, y, lw=1.5, color="#1f77b4")
+        ax.set_ylabel(name)
+        ax.grid(True, alpha=0.25)
+    axes[-1].set_xlabel("Frame")
+    axes[0].set_title(title)
+    fig.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=150)
+        fig.savefig(save_path, dpi=150)
         print(f"Saved plot to {save_path}")
 
     if show:
+        import matplotlib.pyplot as plt
+
         plt.show()
+
+
+def _has_display() -> bool:
+    if os.environ.get("SDL_VIDEODRIVER") == "dummy":
+        return False
+    if os.name == "posix" and sys.platform != "darwin":
+        return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    return True
+
+
+def _load_recording(path) -> dict:
+    # deferred: engine pulls in pygame
+    try:
+        from ..engine.telemetry import load_telemetry
+    except ImportError:
+        # imported as analysis.plot_speed, with kobalt/ on sys.path
+        from engine.telemetry import load_telemetry
+
+    return load_telemetry(path)
@@ -4,29 +4,48 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import pygame
-from widgets import Player, Trail, Widget
-
-from libs.winmode import PygameWindowController, WindowStates
+from engine import (
+    AssetManager,
+    Bindings,
+    Camera,
+    CollisionWorld,
+    DirtyRenderer,
+    Dispatcher,
+    FixedTimestep,
+    KeyboardInput,
+    Level,
+    load_tilemap,
+)
+from widgets import Player, Trail
+
+from libs.winmode import PygameWindowController, RenderTarget, WindowStates
 
 RED = (255, 0, 0)
 GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
+BLACK = (0, 0, 0)
 
 SIZE = (1280, 720)
 FPS = 60
+TICK_RATE = 60  # physics ticks per second, independent of FPS
+ASSET_DIR = "kobalt/assets"
+LEVEL_PATH = "kobalt/assets/levels/parkour.json"
 
 
 def main():
     pygame.init()
     pygame.mouse.set_visible(False)
 
-    controller = PygameWindowController(SIZE, WindowStates.WINDOWED_STATELESS)
+    # the game always draws on a SIZE canvas, scaled to the window
+    controller = PygameWindowController(
+        SIZE,
+        WindowStates.WINDOWED_STATELESS,
+        render_target=RenderTarget(SIZE, scale_mode="fit"),
+    )
     screen = controller.get_screen()
     clock = pygame.time.Clock()
     running = True
 
-    w, h = screen.get_size()
-
     # trail
     trail = Trail(
         SIZE,
@@ -35,84 +54,116 @@ def main():
         max_alpha=100,
     )
 
-    # platforms - calculated parkour
-    platform_image = pygame.image.load("kobalt/assets/platform.png").convert_alpha()
-    platforms = []
-
-    base_y = SIZE[1] - 50
-    base_x = 300
-    platform_w = 120
-    platform_h = 30
-    x_gap = 180  # horizontal distance between platforms
-    y_gap = 20  # vertical distance (must be <= h_max)
-
-    for i in range(5):
-        plat = Widget(
-            screen_size=SIZE,
-            x=base_x + i * x_gap,
-            y=base_y - i * y_gap,
-            width=platform_w,
-            height=platform_h,
-            color=GREEN if i < 4 else BLUE,  # last platform is goal
-            image=None,
-        )
-        platforms.append(plat)
+    # every image loaded once into one atlas, re-converted on mode switches
+    assets = AssetManager(ASSET_DIR)
+    assets.preload()
+    controller.add_screen_listener(lambda screen: assets.convert())
+
+    # level - static platforms baked into chunk surfaces, streamed around
+    # the view and fed to the collision broad-phase
+    world = CollisionWorld()
+    level = Level(
+        load_tilemap(LEVEL_PATH), chunk_size=512, world=world, assets=assets
+    )
+    level_w, level_h = level.size
 
-    # player
-    player_image = pygame.image.load("kobalt/assets/player.png").convert_alpha()
+    # input: rebindable actions, keys polled once per tick
+    bindings = Bindings()
+    input_source = KeyboardInput(bindings)
+
+    # player (world space: the level is wider than the window)
     player_w = 40
     player_h = 40
     player = Player(
-        screen_size=SIZE,
+        screen_size=level.size,
         x=player_w,
-        y=h - player_h,
+        y=level_h - player_h,
         width=player_w,
         height=player_h,
         color=BLUE,
-        image=player_image,
+        collision_world=world,
+        input_source=input_source,
+        wrap=False,
     )
-
-    widgets = [player] + platforms
-
-    widgets = [player] + platforms
+    assets.bind(player, "player")
+
+    widgets = [player]
+    # drawable widgets get their own index: culling visits only what is
+    # near the view (kept apart from the level's colliders)
+    scene = CollisionWorld()
+    scene.add(*widgets)
+
+    # camera follows the player, clamped to the level
+    camera = Camera(screen.get_size(), bounds=(0, 0, level_w, level_h), world=scene)
+    camera.follow(player)
+    view = camera.view()
+    level.stream(view)
+    level_background = level.tilemap.background or BLACK
+
+    def draw_level(surface, rect):
+        surface.fill(level_background, rect)
+        level.draw(surface, view, rect)
+
+    # fixed-timestep physics
+    engine = FixedTimestep(TICK_RATE)
+    # only redraw and present what changed
+    renderer = DirtyRenderer(background=draw_level, present=controller.present)
+    controller.add_screen_listener(lambda screen: renderer.invalidate())
+    engine.add(*widgets)
+    engine.add(camera)  # after the player, so it follows this tick's position
+
+    def quit_game(event):
+        nonlocal running
+        running = False
+
+    # events are routed by type and bound action, no if-chains
+    dispatcher = Dispatcher(bindings)
+    dispatcher.on_event(pygame.QUIT, quit_game)
+    dispatcher.on_action("quit", quit_game)
+    # queued: applied once per frame, repeats coalesce
+    dispatcher.on_action("fullscreen", lambda event: controller.toggle_fullscreen())
+    # monitor geometry is re-queried only after display changes
+    dispatcher.on_any(controller.handle_display_event)
+    # jump presses are buffered for the next tick
+    dispatcher.on_event(pygame.KEYDOWN, player.handle_event)
 
     while running:
         # events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-                if event.key == pygame.K_F11:
-                    controller.set_mode(
-                        WindowStates.WINDOWED_STATELESS
-                        if controller.is_current_fullscreen_mode()
-                        else WindowStates.FULLSCREEN
-                    )
-                    w, h = screen.get_size()
-                    for widget in widgets:
-                        widget.update_position((w, h))
-                player.handle_event(event)
+        dispatcher.process()
+
+        # at most one display change per frame, before anything is drawn
+        controller.apply_pending()
 
         # drawing / updating
-        dt = clock.tick(FPS) / 1000
+        engine.advance(clock.tick(FPS) / 1000)
+        alpha = engine.alpha
         screen = controller.get_screen()
-        screen.fill((0, 0, 0))
+        offset = camera.offset(alpha)
+        # the level is the background repainted under dirty rects; a scroll
+        # only repaints where its tiles were and now are
+        new_view = camera.view(alpha)
+        if new_view != view:
+            old_rects = level.content_rects(view)
+            level.stream(new_view)
+            view = new_view
+            renderer.damage(old_rects + level.content_rects(view))
+        renderer.begin(screen)
 
         # tracker trail
         trail.width, trail.height = player.speed, player.speed
-        trail.draw(screen, player.x + player.width // 2, player.y + player.height // 2)
-
-        # player
-        player.draw(screen, dt)
+        px, py = player.lerp_position(alpha)
+        renderer.add(
+            trail.draw(
+                screen, px + player.width // 2, py + player.height // 2, offset
+            )
+        )
 
-        # # platforms
-        # for platform in platforms:d
-        #     platform.draw(screen, dt)
+        # widgets outside the view are skipped before any draw work
+        for widget in camera.visible(alpha=alpha):
+            renderer.add(widget.render(screen, alpha, offset))
 
-        # display update
-        pygame.display.update()
+        # display update (dirty rects only)
+        renderer.end()
 
     pygame.quit()
 
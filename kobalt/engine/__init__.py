@@ -0,0 +1,43 @@
+from .assets import AssetManager
+from .camera import Camera
+from .collision_world import CollisionWorld
+from .dirty_renderer import DirtyRenderer
+from .fixed_timestep import FixedTimestep
+from .input import (
+    InputSource,
+    KeyboardInput,
+    RecordingInput,
+    ReplayInput,
+    load_replay,
+    save_replay,
+)
+from .level import Level, Solid, Tilemap, TileType, load_tilemap
+from .profiler import Profiler
+from .spatial_hash import SpatialHash
+from .swept_aabb import Contact, move_and_collide, sweep_aabb
+from .telemetry import TelemetryRecorder, load_telemetry
+
+# bindings share key handling with libs.winmode: load them on first use, so
+# the rest of engine imports without the repo root on sys.path
+_LAZY = {
+    "ANY_MODS": ".bindings",
+    "DEFAULT_BINDINGS": ".bindings",
+    "Bindings": ".bindings",
+    "Dispatcher": ".bindings",
+    "normalize_mods": ".bindings",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -0,0 +1,164 @@
+import os
+import time
+
+import pygame
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga")
+
+
+def asset_name(path) -> str:
+    """'kobalt/assets/player.png' -> 'player'."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def pack_shelves(sizes, max_width, padding=1) -> tuple[list, tuple[int, int]]:
+    """
+    Shelf-pack (w, h) boxes, tallest first. Returns the top-left of every box
+    (in input order) and the size of the packed area.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True)
+    positions = [None] * len(sizes)
+    x = y = shelf_h = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w > max_width:  # start a new shelf
+            y += shelf_h + padding
+            x = shelf_h = 0
+        positions[i] = (x, y)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+        width = max(width, x - padding)
+    return positions, (max(width, 1), max(y + shelf_h, 1))
+
+
+class AssetManager:
+    """
+    Loads each image once, packs them into one atlas surface and hands out
+    subsurfaces of it. Images larger than max_size are downscaled at load
+    time (sprites are drawn far smaller than the source art).
+
+    convert() re-converts the atlas to the display pixel format, so blits
+    take the same-format fast path; call it whenever the display surface is
+    recreated. Widgets registered with bind() get their image swapped to
+    the converted subsurface.
+    """
+
+    def __init__(
+        self, root="kobalt/assets", max_size=256, atlas_width=1024, padding=1
+    ):
+        self.root = root
+        self.max_size = max_size
+        self.atlas_width = atlas_width
+        self.padding = padding
+        self.sources = {}  # name -> loaded (and downscaled) image
+        self.atlas = None
+        self.regions = {}  # name -> Rect in the atlas
+        self.images = {}  # name -> atlas subsurface
+        self.bindings = {}  # widget -> name
+        self.load_ms = {}  # name -> file load + scale time
+        self.pack_ms = 0.0
+        self.convert_ms = 0.0
+
+    def __contains__(self, name):
+        return asset_name(name) in self.sources
+
+    def discover(self) -> list:
+        """Image files under root."""
+        return sorted(
+            os.path.join(self.root, f)
+            for f in os.listdir(self.root)
+            if f.lower().endswith(IMAGE_EXTENSIONS)
+        )
+
+    def preload(self, *paths) -> float:
+        """
+        Load images (default: every image in root) and rebuild the atlas.
+        Returns the time taken in ms.
+        """
+        start = time.perf_counter()
+        for path in paths or self.discover():
+            self.load(path, pack=False)
+        self.pack()
+        return (time.perf_counter() - start) * 1000
+
+    def load(self, path, pack=True) -> pygame.Surface:
+        """Load one image; returns its subsurface (the source if not packed)."""
+        name = asset_name(path)
+        if name not in self.sources:
+            if not os.path.dirname(path) and not os.path.exists(path):
+                path = os.path.join(self.root, path)
+            start = time.perf_counter()
+            image = pygame.image.load(path)
+            w, h = image.get_size()
+            scale = self.max_size / max(w, h) if self.max_size else 1
+            if scale < 1:
+                size = (max(1, round(w * scale)), max(1, round(h * scale)))
+                if image.get_bitsize() >= 24:
+                    image = pygame.transform.smoothscale(image, size)
+                else:
+                    image = pygame.transform.scale(image, size)
+            self.sources[name] = image
+            self.load_ms[name] = (time.perf_counter() - start) * 1000
+            if pack:
+                self.pack()
+        return self.images.get(name, self.sources[name])
+
+    def pack(self):
+        start = time.perf_counter()
+        names = list(self.sources)
+        sizes = [self.sources[n].get_size() for n in names]
+        positions, size = pack_shelves(sizes, self.atlas_width, self.padding)
+        atlas = pygame.Surface(size, pygame.SRCALPHA)
+        atlas.blits(
+            [(self.sources[n], pos) for n, pos in zip(names, positions)],
+            doreturn=False,
+        )
+        self.regions = {
+            n: pygame.Rect(pos, sz) for n, pos, sz in zip(names, positions, sizes)
+        }
+        self.pack_ms = (time.perf_counter() - start) * 1000
+        self._set_atlas(atlas)
+        self.convert()
+
+    def convert(self):
+        """Match the atlas to the current display format (no-op without one)."""
+        if self.atlas is None or pygame.display.get_surface() is None:
+            return
+        start = time.perf_counter()
+        self._set_atlas(self.atlas.convert_alpha())
+        self.convert_ms = (time.perf_counter() - start) * 1000
+
+    def _set_atlas(self, atlas):
+        self.atlas = atlas
+        self.images = {n: atlas.subsurface(r) for n, r in self.regions.items()}
+        for widget, name in self.bindings.items():
+            widget.set_image(self.images[name])
+
+    def get(self, name) -> pygame.Surface:
+        """Atlas subsurface for an asset name or path."""
+        image = self.images.get(asset_name(name))
+        if image is None:
+            # not preloaded: load it now (bare names are .png files in root)
+            return self.load(name if os.path.splitext(name)[1] else name + ".png")
+        return image
+
+    def bind(self, widget, name):
+        """Set widget's image and keep it current across convert()."""
+        image = self.get(name)
+        self.bindings[widget] = asset_name(name)
+        widget.set_image(image)
+        return widget
+
+    def unbind(self, widget):
+        self.bindings.pop(widget, None)
+
+    def stats(self) -> dict:
+        w, h = self.atlas.get_size() if self.atlas else (0, 0)
+        return {
+            "images": len(self.sources),
+            "atlas_size": (w, h),
+            "atlas_kb": w * h * 4 / 1024,
+            "load_ms": sum(self.load_ms.values()),
+            "pack_ms": self.pack_ms,
+            "convert_ms": self.convert_ms,
+        }
@@ -0,0 +1,144 @@
+from collections import defaultdict
+
+import pygame
+
+from libs.winmode import normalize_mods
+
+from .input import JUMP, LEFT, RIGHT
+
+TOGGLE_STRAFE = "toggle_strafe"
+FULLSCREEN = "fullscreen"
+QUIT = "quit"
+
+# binding modifier that matches whatever modifiers are held
+ANY_MODS = -1
+
+DEFAULT_BINDINGS = {
+    LEFT: [pygame.K_LEFT, pygame.K_a],
+    RIGHT: [pygame.K_RIGHT, pygame.K_d],
+    JUMP: [pygame.K_SPACE, pygame.K_UP],
+    TOGGLE_STRAFE: [pygame.K_p],
+    FULLSCREEN: [pygame.K_F11],
+    QUIT: [pygame.K_ESCAPE],
+}
+
+
+class Bindings:
+    """
+    Rebindable action -> key table.
+    Compiled into a dict keyed by (event type, key, modifiers), so finding
+    the actions of an event is at most two lookups however many are bound.
+    A binding is a key, or (key, mods) to require exact modifiers.
+    """
+
+    def __init__(self, bindings=None, event_type=pygame.KEYDOWN):
+        self.event_type = event_type
+        self._keys = {}  # action -> [(key, mods)]
+        self._table = {}  # (type, key, mods) -> (actions,)
+        self.version = 0  # bumped on every change, for caches of keys_for
+        for action, keys in (bindings or DEFAULT_BINDINGS).items():
+            self.rebind(action, *keys)
+
+    def __contains__(self, action):
+        return action in self._keys
+
+    @property
+    def actions(self) -> list:
+        return list(self._keys)
+
+    def bind(self, action, key, mods=ANY_MODS):
+        if isinstance(key, tuple):
+            key, mods = key
+        if mods != ANY_MODS:
+            mods = normalize_mods(mods)
+        keys = self._keys.setdefault(action, [])
+        if (key, mods) not in keys:
+            keys.append((key, mods))
+            self._compile()
+
+    def unbind(self, action, key=None):
+        """Drop one key of action, or the whole action."""
+        if key is None:
+            self._keys.pop(action, None)
+        else:
+            keys = self._keys.get(action, [])
+            self._keys[action] = [b for b in keys if b[0] != key]
+        self._compile()
+
+    def rebind(self, action, *keys):
+        """Replace action's keys."""
+        self._keys[action] = []
+        for key in keys:
+            self.bind(action, key)
+        self._compile()
+
+    def keys_for(self, action) -> list:
+        """Key codes bound to action (any modifiers)."""
+        return [key for key, _ in self._keys.get(action, ())]
+
+    def actions_for(self, event) -> tuple:
+        """Actions an event triggers (empty for anything but bound keys)."""
+        key = getattr(event, "key", None)
+        if key is None:
+            return ()
+        table = self._table
+        exact = table.get((event.type, key, normalize_mods(event.mod)), ())
+        return exact + table.get((event.type, key, ANY_MODS), ())
+
+    def _compile(self):
+        table = defaultdict(tuple)
+        for action, keys in self._keys.items():
+            for key, mods in keys:
+                table[(self.event_type, key, mods)] += (action,)
+        self._table = dict(table)
+        self.version += 1
+
+
+class Dispatcher:
+    """
+    Routes events to handlers through dict lookups instead of if-chains:
+    on_event(type) for raw event types, on_action(name) for bound actions,
+    on_any() for every event. Handlers take the event.
+    """
+
+    def __init__(self, bindings: Bindings = None):
+        self.bindings = bindings or Bindings()
+        self._by_type = defaultdict(list)
+        self._by_action = defaultdict(list)
+        self._any = []
+
+    def on_event(self, event_type, handler):
+        self._by_type[event_type].append(handler)
+        return handler
+
+    def on_action(self, action, handler):
+        self._by_action[action].append(handler)
+        return handler
+
+    def on_any(self, handler):
+        self._any.append(handler)
+        return handler
+
+    def dispatch(self, event) -> bool:
+        """Run the handlers for event; True if any ran."""
+        handled = False
+        for handler in self._any:
+            handler(event)
+            handled = True
+        for handler in self._by_type.get(event.type, ()):
+            handler(event)
+            handled = True
+        by_action = self._by_action
+        for action in self.bindings.actions_for(event):
+            for handler in by_action.get(action, ()):
+                handler(event)
+                handled = True
+        return handled
+
+    def process(self, events=None) -> int:
+        """Dispatch events (default: the pygame queue), returns how many."""
+        count = 0
+        for event in pygame.event.get() if events is None else events:
+            self.dispatch(event)
+            count += 1
+        return count
@@ -0,0 +1,134 @@
+import math
+
+import pygame
+
+
+class Camera:
+    """
+    World-space view that smoothly follows a target widget.
+    Stepped with the simulation (add it to a FixedTimestep) and interpolated
+    like widgets when rendering. World-space widgets draw at offset(alpha);
+    visible() culls them against the view before any draw work happens,
+    through a CollisionWorld index of them when one is given.
+    """
+
+    def __init__(
+        self, view_size, bounds=None, smoothing=8.0, deadzone=(0, 0), world=None
+    ):
+        self.width, self.height = view_size
+        # world area the view stays inside, (x, y, w, h) or None for unbounded
+        self.bounds = pygame.Rect(bounds) if bounds else None
+        # higher follows tighter; 1 - exp(-smoothing * dt) of the gap per tick
+        self.smoothing = smoothing
+        # half-size of the box around the view centre the target moves freely in
+        self.deadzone = deadzone
+        # CollisionWorld indexing the drawable widgets, for visible()
+        self.world = world
+        self.target = None
+        self.x = self.y = 0.0
+        self.prev_x = self.prev_y = 0.0
+
+    def follow(self, widget, snap=True):
+        self.target = widget
+        if snap:
+            self.snap_to_target()
+
+    def resize(self, view_size):
+        """New window size: keep the view centred where it was."""
+        cx, cy = self.x + self.width / 2, self.y + self.height / 2
+        self.width, self.height = view_size
+        self.x, self.y = self._clamp(cx - self.width / 2, cy - self.height / 2)
+        self.snap()
+
+    def snap(self):
+        """Skip interpolation (teleports, resizes)."""
+        self.prev_x, self.prev_y = self.x, self.y
+
+    def snap_to_target(self):
+        if self.target is not None:
+            self.x, self.y = self._clamp(*self._centred_on(self.target))
+        self.snap()
+
+    def update(self, dt):
+        self.prev_x, self.prev_y = self.x, self.y
+        if self.target is None:
+            return
+        goal_x, goal_y = self._centred_on(self.target)
+        dzx, dzy = self.deadzone
+        # only chase the part of the offset outside the deadzone
+        gap_x = goal_x - self.x
+        gap_y = goal_y - self.y
+        gap_x = math.copysign(max(abs(gap_x) - dzx, 0), gap_x)
+        gap_y = math.copysign(max(abs(gap_y) - dzy, 0), gap_y)
+        t = 1 - math.exp(-self.smoothing * dt) if self.smoothing else 1.0
+        self.x, self.y = self._clamp(self.x + gap_x * t, self.y + gap_y * t)
+
+    def _centred_on(self, widget):
+        return (
+            widget.x + widget.width / 2 - self.width / 2,
+            widget.y + widget.height / 2 - self.height / 2,
+        )
+
+    def _clamp(self, x, y):
+        b = self.bounds
+        if b is None:
+            return x, y
+        # a world smaller than the view is centred instead
+        if b.w <= self.width:
+            x = b.x + (b.w - self.width) / 2
+        else:
+            x = min(max(x, b.left), b.right - self.width)
+        if b.h <= self.height:
+            y = b.y + (b.h - self.height) / 2
+        else:
+            y = min(max(y, b.top), b.bottom - self.height)
+        return x, y
+
+    def offset(self, alpha=1.0) -> tuple[int, int]:
+        """Interpolated view top-left, rounded so everything shifts together."""
+        if alpha >= 1.0:
+            return round(self.x), round(self.y)
+        return (
+            round(self.prev_x + (self.x - self.prev_x) * alpha),
+            round(self.prev_y + (self.y - self.prev_y) * alpha),
+        )
+
+    def view(self, alpha=1.0) -> pygame.Rect:
+        return pygame.Rect(self.offset(alpha), (self.width, self.height))
+
+    def visible(self, widgets=None, alpha=1.0, margin=0, world=None, max_step=64):
+        """
+        Widgets whose interpolated bounds touch the view.
+
+        With a world (or self.world) only the grid cells around the view are
+        visited, so the cost follows what is on screen; widgets then only
+        filters the hits (pass a set), which come in no particular order.
+        The grid holds current positions, so the query is padded by
+        max_step, the farthest a widget moves in one tick. Without a world,
+        widgets is scanned linearly.
+        """
+        view = self.view(alpha).inflate(margin * 2, margin * 2)
+        world = self.world if world is None else world
+        if world is not None:
+            candidates = world.query_rect(view.inflate(max_step * 2, max_step * 2))
+            if widgets is not None:
+                candidates = [w for w in candidates if w in widgets]
+        else:
+            candidates = list(widgets or ())
+        hits = view.collidelistall([_drawn_rect(w, alpha) for w in candidates])
+        return [candidates[i] for i in hits]
+
+    def to_screen(self, x, y, alpha=1.0):
+        ox, oy = self.offset(alpha)
+        return x - ox, y - oy
+
+    def to_world(self, x, y, alpha=1.0):
+        ox, oy = self.offset(alpha)
+        return x + ox, y + oy
+
+
+def _drawn_rect(widget, alpha) -> pygame.Rect:
+    """Where widget is drawn at alpha (interpolated when it can be)."""
+    lerp = getattr(widget, "lerp_position", None)
+    x, y = lerp(alpha) if lerp is not None else (widget.x, widget.y)
+    return pygame.Rect(x, y, widget.width, widget.height)
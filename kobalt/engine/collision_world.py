@@ -0,0 +1,132 @@
+import pygame
+
+from .spatial_hash import SpatialHash
+from .swept_aabb import move_and_collide
+
+
+class CollisionWorld:
+    """
+    Collision queries over a set of widgets.
+    Widgets are indexed in a SpatialHash and re-bucketed lazily: moving a
+    widget only marks it dirty, the grid catches up before the next query.
+    """
+
+    def __init__(self, cell_size=128):
+        self.grid = SpatialHash(cell_size)
+        self.rects = {}  # widget -> pygame.Rect, updated in place
+        self._dirty = set()
+
+    def __len__(self):
+        return len(self.rects)
+
+    def __contains__(self, widget):
+        return widget in self.rects
+
+    def add(self, *widgets):
+        for widget in widgets:
+            rect = pygame.Rect(widget.x, widget.y, widget.width, widget.height)
+            self.rects[widget] = rect
+            self.grid.insert(widget, rect)
+            widget._world = self
+
+    def remove(self, widget):
+        if self.rects.pop(widget, None) is None:
+            return
+        self.grid.remove(widget)
+        self._dirty.discard(widget)
+        widget._world = None
+
+    def mark_dirty(self, widget):
+        self._dirty.add(widget)
+
+    def flush(self):
+        """Apply pending moves to the grid."""
+        if not self._dirty:
+            return
+        rects = self.rects
+        grid = self.grid
+        for widget in self._dirty:
+            rect = rects.get(widget)
+            if rect is None:
+                continue
+            rect.update(widget.x, widget.y, widget.width, widget.height)
+            grid.update(widget, rect)
+        self._dirty.clear()
+
+    def candidates(self, x, y, w, h) -> set:
+        """Broad-phase only: widgets near the (float) box, unfiltered."""
+        self.flush()
+        # pad by a pixel so truncated int rects never fall through
+        return self.grid.query_rect(x - 1, y - 1, w + 2, h + 2)
+
+    def query_point(self, x, y) -> list:
+        self.flush()
+        rects = self.rects
+        return [w for w in self.grid.query_point(x, y) if rects[w].collidepoint(x, y)]
+
+    def query_rect(self, rect, exclude=None) -> list:
+        """Widgets whose bounds overlap rect."""
+        self.flush()
+        rect = pygame.Rect(rect)
+        candidates = self.grid.query_rect(*rect)
+        candidates.discard(exclude)
+        if not candidates:
+            return []
+        candidates = list(candidates)
+        rects = self.rects
+        # one C call for the narrow phase
+        hits = rect.collidelistall([rects[w] for w in candidates])
+        return [candidates[i] for i in hits]
+
+    def collisions(self, widget) -> list:
+        """Widgets overlapping widget (widget itself excluded)."""
+        self.flush()
+        rect = self.rects.get(widget)
+        if rect is None:
+            rect = pygame.Rect(widget.x, widget.y, widget.width, widget.height)
+        return self.query_rect(rect, exclude=widget)
+
+    def sweep(self, widget, dx, dy, max_iterations=3):
+        """
+        Move widget's box by (dx, dy) against the indexed widgets.
+        Returns (x, y, contacts) without touching the widget itself.
+        """
+        return move_and_collide(
+            widget.x,
+            widget.y,
+            widget.width,
+            widget.height,
+            dx,
+            dy,
+            self,
+            exclude=widget,
+            max_iterations=max_iterations,
+        )
+
+    def pairs(self) -> list:
+        """Every overlapping pair of indexed widgets, each reported once."""
+        self.flush()
+        rects = self.rects
+        seen = set()
+        result = []
+        for cell in self.grid.cells.values():
+            if len(cell) < 2:
+                continue
+            members = list(cell)
+            for i, a in enumerate(members):
+                rect_a = rects[a]
+                for b in members[i + 1 :]:
+                    key = (id(a), id(b)) if id(a) < id(b) else (id(b), id(a))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if rect_a.colliderect(rects[b]):
+                        result.append((a, b))
+        return result
+
+    def clear(self):
+        for widget in self.rects:
+            widget._world = None
+        self.rects.clear()
+        self.grid.clear()
+        self._dirty.clear()
@@ -0,0 +1,108 @@
+import pygame
+
+
+class DirtyRenderer:
+    """
+    Dirty-rectangle frame presenter.
+    Each frame, the areas drawn on the previous frame are cleared, widgets
+    report what they draw through add(), and only the union of old and new
+    areas is pushed with display.update(rects). When the dirty area covers
+    more than full_redraw_ratio of the screen, or the screen changed size or
+    flags, the whole frame is cleared and flipped instead. pygame keeps the
+    same display Surface object across set_mode(), so register invalidate()
+    as a screen listener to catch every mode change.
+    background is a color, a Surface (e.g. a Level layer) that is copied
+    back under cleared areas, or a callable background(screen, rect) that
+    repaints rect. damage() marks areas whose background itself changed
+    (e.g. a scrolled level) for repainting and presenting.
+    """
+
+    def __init__(
+        self, background=(0, 0, 0), full_redraw_ratio=0.5, padding=1, present=None
+    ):
+        self.background = background
+        self.full_redraw_ratio = full_redraw_ratio
+        # grow every rect a little so sub-pixel positions are fully covered
+        self.padding = padding
+        # present(rects) shows the frame, None meaning all of it; defaults to
+        # display.update/flip (a window controller's present with a canvas)
+        self.present = present
+        self.screen = None
+        self._screen_format = None  # (size, flags) of the last frame's screen
+        self.full_redraw = True
+        self.last_update_rects = None  # None means the last frame was a full flip
+        self._prev_rects = []
+        self._rects = []
+        self._damage = []
+
+    def invalidate(self):
+        """Force a full clear and flip on the next frame."""
+        self.full_redraw = True
+
+    def damage(self, rects):
+        """Repaint the background in rects and present them next frame."""
+        self._damage.extend(pygame.Rect(rect) for rect in rects)
+
+    def begin(self, screen: pygame.Surface):
+        screen_format = (screen.get_size(), screen.get_flags())
+        if screen is not self.screen or screen_format != self._screen_format:
+            # new or resized display surface: nothing on it can be trusted
+            self.screen = screen
+            self._screen_format = screen_format
+            self.full_redraw = True
+        background = self.background
+        stale = self._prev_rects + self._damage
+        if callable(background):
+            if self.full_redraw:
+                background(screen, screen.get_rect())
+            else:
+                for rect in stale:
+                    background(screen, rect)
+        elif isinstance(background, pygame.Surface):
+            if self.full_redraw:
+                screen.fill((0, 0, 0))
+                screen.blit(background, (0, 0))
+            else:
+                blit = screen.blit
+                for rect in stale:
+                    blit(background, rect, rect)
+        elif self.full_redraw:
+            screen.fill(background)
+        else:
+            fill = screen.fill
+            for rect in stale:
+                fill(background, rect)
+        self._rects = []
+
+    def add(self, rect):
+        """Record an area drawn this frame (None is ignored)."""
+        if rect:
+            pad = self.padding
+            self._rects.append(pygame.Rect(rect).inflate(pad * 2, pad * 2))
+        return rect
+
+    def end(self):
+        screen = self.screen
+        clip = screen.get_rect()
+        rects = [r.clip(clip) for r in self._rects]
+        rects = [r for r in rects if r.w and r.h]
+        damage = [r.clip(clip) for r in self._damage]
+        dirty = self._prev_rects + [r for r in damage if r.w and r.h] + rects
+
+        area = sum(r.w * r.h for r in dirty)
+        if self.full_redraw or area > clip.w * clip.h * self.full_redraw_ratio:
+            if self.present is not None:
+                self.present(None)
+            else:
+                pygame.display.flip()
+            self.last_update_rects = None
+        else:
+            if self.present is not None:
+                self.present(dirty)
+            else:
+                pygame.display.update(dirty)
+            self.last_update_rects = dirty
+
+        self.full_redraw = False
+        self._prev_rects = rects
+        self._damage = []
@@ -0,0 +1,70 @@
+class FixedTimestep:
+    """
+    Fixed-timestep simulation driver.
+    Frame time is accumulated and widgets are stepped in whole ticks of
+    `1 / tick_rate` seconds; the leftover fraction is exposed as `alpha`
+    for interpolated rendering.
+    """
+
+    def __init__(self, tick_rate=60, max_steps=5):
+        if tick_rate <= 0:
+            raise ValueError("tick_rate must be positive")
+        if max_steps < 1:
+            raise ValueError("max_steps must be at least 1")
+        self.tick_rate = tick_rate
+        self.dt = 1 / tick_rate
+        # catch-up cap: a long stall drops time instead of spiralling
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped_time = 0.0
+        self.widgets = []
+        self.tick_callbacks = []
+
+    def add(self, *widgets):
+        for widget in widgets:
+            if widget not in self.widgets:
+                self.widgets.append(widget)
+
+    def remove(self, widget):
+        if widget in self.widgets:
+            self.widgets.remove(widget)
+
+    def on_tick(self, callback):
+        """Register callback(dt) to run after the widgets on every tick."""
+        self.tick_callbacks.append(callback)
+        return callback
+
+    def tick(self):
+        """Run exactly one fixed step."""
+        dt = self.dt
+        for widget in self.widgets:
+            widget.update(dt)
+        for callback in self.tick_callbacks:
+            callback(dt)
+        self.ticks += 1
+
+    def advance(self, frame_dt) -> int:
+        """Feed frame time (seconds), returns how many ticks were run."""
+        self.accumulator += frame_dt
+        steps = 0
+        while self.accumulator >= self.dt and steps < self.max_steps:
+            self.tick()
+            self.accumulator -= self.dt
+            steps += 1
+        if self.accumulator >= self.dt:
+            # behind by more than max_steps ticks, keep only the fraction
+            dropped = self.accumulator - self.accumulator % self.dt
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """How far (0..1) the current frame is between the last two ticks."""
+        return self.accumulator / self.dt
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped_time = 0.0
@@ -0,0 +1,167 @@
+import json
+
+import pygame
+
+LEFT = "left"
+RIGHT = "right"
+JUMP = "jump"
+
+# replay frames store one bitmask per tick
+ACTION_BITS = {LEFT: 1, RIGHT: 2, JUMP: 4}
+
+
+class InputSource:
+    """
+    Per-tick input for a widget: held actions plus one-shot presses.
+    begin_tick() is called once at the start of every simulation tick.
+    """
+
+    def begin_tick(self):
+        pass
+
+    def is_held(self, action) -> bool:
+        return False
+
+    def consume(self, action) -> bool:
+        """True once if action was pressed since the last consume."""
+        return False
+
+    def handle_event(self, event: pygame.event.Event):
+        pass
+
+    def mask(self) -> int:
+        """Bitmask of the current tick (held actions and pending presses)."""
+        return 0
+
+
+class KeyboardInput(InputSource):
+    """Keyboard through rebindable Bindings (engine.bindings)."""
+
+    HELD_ACTIONS = (LEFT, RIGHT)
+    PRESS_ACTIONS = frozenset((JUMP,))
+
+    def __init__(self, bindings=None):
+        if bindings is None:
+            from .bindings import Bindings  # bindings imports this module
+
+            bindings = Bindings()
+        self.bindings = bindings
+        self._held = set()
+        self._pressed = set()
+        self._held_keys = ()
+        self._version = None
+
+    def begin_tick(self):
+        if self._version != self.bindings.version:
+            # keys per held action, rebuilt only after a rebind
+            self._held_keys = [
+                (action, self.bindings.keys_for(action)) for action in self.HELD_ACTIONS
+            ]
+            self._version = self.bindings.version
+        # one get_pressed() snapshot per tick
+        keys = pygame.key.get_pressed()
+        self._held = {
+            action
+            for action, codes in self._held_keys
+            if any(keys[code] for code in codes)
+        }
+
+    def is_held(self, action) -> bool:
+        return action in self._held
+
+    def consume(self, action) -> bool:
+        if action in self._pressed:
+            self._pressed.discard(action)
+            return True
+        return False
+
+    def handle_event(self, event: pygame.event.Event):
+        for action in self.bindings.actions_for(event):
+            if action in self.PRESS_ACTIONS:
+                self._pressed.add(action)
+
+    def press(self, action):
+        """Buffer a one-shot press, e.g. from a Dispatcher action handler."""
+        self._pressed.add(action)
+
+    def mask(self) -> int:
+        return _to_mask(self._held | self._pressed)
+
+
+class ReplayInput(InputSource):
+    """Plays back recorded per-tick bitmasks; idles once they run out."""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.index = 0
+        self._mask = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.index >= len(self.frames)
+
+    def begin_tick(self):
+        if self.index < len(self.frames):
+            self._mask = self.frames[self.index]
+            self.index += 1
+        else:
+            self._mask = 0
+
+    def is_held(self, action) -> bool:
+        return bool(self._mask & ACTION_BITS[action])
+
+    def consume(self, action) -> bool:
+        bit = ACTION_BITS[action]
+        if self._mask & bit:
+            self._mask &= ~bit
+            return True
+        return False
+
+    def mask(self) -> int:
+        return self._mask
+
+
+class RecordingInput(InputSource):
+    """Wraps another source and records what it reported on every tick."""
+
+    def __init__(self, source: InputSource):
+        self.source = source
+        self.frames = []
+
+    def begin_tick(self):
+        self.source.begin_tick()
+        self.frames.append(self.source.mask())
+
+    def is_held(self, action) -> bool:
+        return self.source.is_held(action)
+
+    def consume(self, action) -> bool:
+        return self.source.consume(action)
+
+    def handle_event(self, event: pygame.event.Event):
+        self.source.handle_event(event)
+
+    def mask(self) -> int:
+        return self.source.mask()
+
+    def save(self, path, tick_rate=60):
+        save_replay(path, self.frames, tick_rate)
+
+
+def _to_mask(actions) -> int:
+    mask = 0
+    for action in actions:
+        mask |= ACTION_BITS.get(action, 0)
+    return mask
+
+
+def save_replay(path, frames, tick_rate=60):
+    with open(path, "w") as f:
+        json.dump({"tick_rate": tick_rate, "frames": list(frames)}, f)
+
+
+def load_replay(path):
+    """Returns (frames, tick_rate)."""
+    with open(path) as f:
+        data = json.load(f)
+    return data["frames"], data.get("tick_rate", 60)
@@ -0,0 +1,336 @@
+import json
+from typing import NamedTuple
+
+import numpy as np
+import pygame
+
+EMPTY = 0
+
+
+class TileType(NamedTuple):
+    name: str
+    color: tuple
+    solid: bool = True
+    image: str | None = None
+
+
+class Tilemap:
+    """
+    Grid of tile ids (uint8, 0 is empty) with a palette of TileTypes.
+    One byte per tile, so even large levels stay small in memory.
+    """
+
+    def __init__(self, tiles, tile_size, palette, background=None):
+        self.tiles = np.asarray(tiles, dtype=np.uint8)
+        if self.tiles.ndim != 2:
+            raise ValueError("tiles must be a 2D grid")
+        self.tile_size = tile_size
+        self.palette = palette  # id -> TileType
+        self.background = background
+
+    @property
+    def rows(self) -> int:
+        return self.tiles.shape[0]
+
+    @property
+    def cols(self) -> int:
+        return self.tiles.shape[1]
+
+    @property
+    def pixel_size(self) -> tuple[int, int]:
+        return self.cols * self.tile_size, self.rows * self.tile_size
+
+    def solid_mask(self) -> np.ndarray:
+        solid = np.zeros(256, dtype=bool)
+        for tile_id, tile in self.palette.items():
+            solid[tile_id] = tile.solid
+        return solid[self.tiles]
+
+    @classmethod
+    def from_rows(cls, rows, legend, tile_size, width=None, height=None, **kwargs):
+        """
+        Build from strings, one character per tile. legend maps characters to
+        TileTypes; any other character is empty. Short rows and missing rows
+        are padded up to width x height.
+        """
+        chars = list(legend)
+        ids = {ch: i + 1 for i, ch in enumerate(chars)}
+        width = width or max((len(row) for row in rows), default=0)
+        height = height or len(rows)
+        tiles = np.zeros((height, width), dtype=np.uint8)
+        for r, row in enumerate(rows[:height]):
+            for c, ch in enumerate(row[:width]):
+                tiles[r, c] = ids.get(ch, EMPTY)
+        palette = {ids[ch]: legend[ch] for ch in chars}
+        return cls(tiles, tile_size, palette, **kwargs)
+
+
+def load_tilemap(path) -> Tilemap:
+    """
+    Load a JSON level:
+
+        {"tile_size": 10, "width": 128, "height": 72, "background": [0, 0, 0],
+         "legend": {"#": {"name": "platform", "color": [0, 255, 0]}},
+         "rows": ["", "....####", ...]}
+
+    Rows are strings with one legend character per tile; trailing empty
+    tiles and rows can be left out.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    legend = {
+        ch: TileType(
+            spec.get("name", ch),
+            tuple(spec.get("color", (255, 255, 255))),
+            spec.get("solid", True),
+            spec.get("image"),
+        )
+        for ch, spec in data["legend"].items()
+    }
+    background = data.get("background")
+    return Tilemap.from_rows(
+        data["rows"],
+        legend,
+        data["tile_size"],
+        width=data.get("width"),
+        height=data.get("height"),
+        background=tuple(background) if background else None,
+    )
+
+
+class Solid:
+    """Static box fed to a CollisionWorld (the fields it reads from widgets)."""
+
+    __slots__ = ("x", "y", "width", "height", "_world")
+
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self._world = None
+
+    def __repr__(self):
+        return f"Solid({self.x}, {self.y}, {self.width}, {self.height})"
+
+
+def merge_solids(mask, x0, y0, tile_size) -> list:
+    """
+    Cover the True cells of mask with few rectangles: runs along each row,
+    extended downwards while the row below has the same run.
+    """
+    solids = []
+    open_runs = {}  # (c0, c1) -> Solid growing downwards
+    for r in range(mask.shape[0]):
+        row = np.concatenate(([False], mask[r], [False]))
+        edges = np.flatnonzero(row[1:] != row[:-1])
+        runs = {}
+        for c0, c1 in zip(edges[::2].tolist(), edges[1::2].tolist()):
+            solid = open_runs.get((c0, c1))
+            if solid is None:
+                solid = Solid(
+                    x0 + c0 * tile_size,
+                    y0 + r * tile_size,
+                    (c1 - c0) * tile_size,
+                    tile_size,
+                )
+                solids.append(solid)
+            else:
+                solid.height += tile_size
+            runs[(c0, c1)] = solid
+        open_runs = runs
+    return solids
+
+
+class Chunk(NamedTuple):
+    surface: pygame.Surface | None  # None when the chunk has no tiles
+    solids: list
+    rect: pygame.Rect
+    bounds: pygame.Rect  # world area of the drawn tiles, empty if none
+
+
+class Level:
+    """
+    Tilemap streamed in square chunks.
+    Each loaded chunk owns a baked surface of its tiles and merged Solids in
+    the collision world. update(view) loads chunks near the view, drops
+    those that left it, and recomposes `layer` (the static background for
+    the view) only when something changed, so drawing the level costs one
+    blit per visible chunk per change instead of one per tile per frame.
+    A scrolling view draws straight from the chunks instead: draw(area=...)
+    repaints part of the view and content_rects() says where tiles are.
+    """
+
+    def __init__(
+        self, tilemap: Tilemap, chunk_size=512, world=None, margin=1, assets=None
+    ):
+        self.tilemap = tilemap
+        ts = tilemap.tile_size
+        # chunks hold whole tiles
+        self.chunk_tiles = max(1, chunk_size // ts)
+        self.chunk_size = self.chunk_tiles * ts
+        self.world = world
+        self.margin = margin  # chunks kept loaded around the view
+        self.assets = assets  # AssetManager for tile images, optional
+        self.chunks = {}  # (cx, cy) -> Chunk
+        self.layer = None
+        self.view = None
+        self._solid = tilemap.solid_mask()
+        self._images = {}
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.tilemap.pixel_size
+
+    def chunk_range(self, rect, margin=0):
+        cs = self.chunk_size
+        cols = -(-self.tilemap.cols // self.chunk_tiles)
+        rows = -(-self.tilemap.rows // self.chunk_tiles)
+        cx0 = max(0, rect.left // cs - margin)
+        cy0 = max(0, rect.top // cs - margin)
+        cx1 = min(cols - 1, (rect.right - 1) // cs + margin)
+        cy1 = min(rows - 1, (rect.bottom - 1) // cs + margin)
+        return cx0, cy0, cx1, cy1
+
+    def _keys(self, rect, margin):
+        cx0, cy0, cx1, cy1 = self.chunk_range(rect, margin)
+        return {
+            (cx, cy) for cy in range(cy0, cy1 + 1) for cx in range(cx0, cx1 + 1)
+        }
+
+    def stream(self, view) -> bool:
+        """Load chunks around view and unload far ones; True if any changed."""
+        view = pygame.Rect(view)
+        wanted = self._keys(view, self.margin)
+        # one extra chunk of hysteresis so walking along an edge doesn't thrash
+        keep = self._keys(view, self.margin + 1)
+        changed = False
+        for key in [key for key in self.chunks if key not in keep]:
+            self.unload(key)
+            changed = True
+        for key in wanted - self.chunks.keys():
+            self.load(key)
+            changed = True
+        return changed
+
+    def load(self, key) -> Chunk:
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            return chunk
+        cx, cy = key
+        n = self.chunk_tiles
+        ts = self.tilemap.tile_size
+        r0, c0 = cy * n, cx * n
+        tiles = self.tilemap.tiles[r0 : r0 + n, c0 : c0 + n]
+        rect = pygame.Rect(c0 * ts, r0 * ts, tiles.shape[1] * ts, tiles.shape[0] * ts)
+
+        surface = self._bake(tiles) if tiles.any() else None
+        bounds = pygame.Rect(rect.topleft, (0, 0))
+        if surface is not None:
+            bounds = surface.get_bounding_rect().move(rect.topleft)
+        solids = merge_solids(self._solid[r0 : r0 + n, c0 : c0 + n], *rect.topleft, ts)
+        if self.world is not None and solids:
+            self.world.add(*solids)
+        chunk = self.chunks[key] = Chunk(surface, solids, rect, bounds)
+        return chunk
+
+    def unload(self, key):
+        chunk = self.chunks.pop(key, None)
+        if chunk is None or self.world is None:
+            return
+        for solid in chunk.solids:
+            self.world.remove(solid)
+
+    def _bake(self, tiles) -> pygame.Surface:
+        ts = self.tilemap.tile_size
+        surface = pygame.Surface(
+            (tiles.shape[1] * ts, tiles.shape[0] * ts), pygame.SRCALPHA
+        )
+        for tile_id in np.unique(tiles).tolist():
+            if tile_id == EMPTY:
+                continue
+            tile = self.tilemap.palette[tile_id]
+            image = self._tile_image(tile)
+            rows, cols = np.nonzero(tiles == tile_id)
+            if image is not None:
+                surface.blits(
+                    [(image, (c * ts, r * ts)) for r, c in zip(rows, cols)],
+                    doreturn=False,
+                )
+            else:
+                for r, c in zip(rows.tolist(), cols.tolist()):
+                    surface.fill(tile.color, (c * ts, r * ts, ts, ts))
+        return surface
+
+    def _tile_image(self, tile: TileType):
+        if tile.image is None:
+            return None
+        image = self._images.get(tile.image)
+        if image is None:
+            ts = self.tilemap.tile_size
+            if self.assets is not None:
+                image = self.assets.get(tile.image)
+            else:
+                image = pygame.image.load(tile.image)
+                if pygame.display.get_surface() is not None:
+                    image = image.convert_alpha()
+            image = self._images[tile.image] = pygame.transform.scale(
+                image, (ts, ts)
+            )
+        return image
+
+    def visible_chunks(self, view) -> list:
+        view = pygame.Rect(view)
+        return [
+            chunk
+            for key in sorted(self._keys(view, 0))
+            if (chunk := self.chunks.get(key)) is not None
+            and chunk.surface is not None
+        ]
+
+    def draw(self, surface: pygame.Surface, view, area=None) -> pygame.Rect:
+        """Blit the visible chunks of view onto surface (view's top-left at
+        the surface origin), only inside area (surface coordinates) if given."""
+        view = pygame.Rect(view)
+        ox, oy = view.topleft
+        clip = surface.get_rect()
+        area = clip if area is None else pygame.Rect(area).clip(clip)
+        blits = []
+        for chunk in self.visible_chunks(view):
+            target = chunk.bounds.move(-ox, -oy).clip(area)
+            if target.w and target.h:
+                source = target.move(ox - chunk.rect.x, oy - chunk.rect.y)
+                blits.append((chunk.surface, target, source))
+        surface.blits(blits, doreturn=False)
+        return area
+
+    def content_rects(self, view) -> list:
+        """Where the loaded tiles of view are drawn, in view coordinates."""
+        view = pygame.Rect(view)
+        ox, oy = view.topleft
+        screen = pygame.Rect((0, 0), view.size)
+        rects = [
+            chunk.bounds.move(-ox, -oy).clip(screen)
+            for chunk in self.visible_chunks(view)
+        ]
+        return [rect for rect in rects if rect.w and rect.h]
+
+    def update(self, view) -> bool:
+        """Stream around view and rebuild `layer` if the view or the loaded
+        chunks changed. Returns True when layer was rebuilt."""
+        view = pygame.Rect(view)
+        changed = self.stream(view)
+        if not changed and view == self.view and self.layer is not None:
+            return False
+        if self.layer is None or self.layer.get_size() != view.size:
+            self.layer = pygame.Surface(view.size)
+        self.layer.fill(self.tilemap.background or (0, 0, 0))
+        self.draw(self.layer, view)
+        self.view = view
+        return True
+
+    def clear(self):
+        for key in list(self.chunks):
+            self.unload(key)
+        self.layer = None
+        self.view = None
@@ -0,0 +1,153 @@
+import json
+from collections import deque
+from functools import wraps
+from time import perf_counter_ns
+
+import numpy as np
+
+
+class _NullPhase:
+    """Shared no-op context manager handed out while profiling is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """One timed use of a phase; fresh per use, so nesting keeps each start."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, perf_counter_ns() - self.start)
+        return False
+
+
+class Profiler:
+    """
+    Per-phase frame timing built on perf_counter_ns.
+
+    `with profiler.phase("draw"):` and `@profiler.timed("update")` record a
+    duration per use; the last `window` samples of every phase are kept in
+    a ring buffer for percentiles. While disabled, phase() returns a shared
+    no-op context and timed functions only pay one attribute check.
+    With tracing on, every sample is also kept (bounded) for
+    export_chrome_trace().
+    """
+
+    FRAME = "frame"
+
+    def __init__(
+        self, enabled=False, window=240, tracing=False, trace_capacity=200_000
+    ):
+        self.enabled = enabled
+        self.window = window
+        self.tracing = tracing
+        self.samples = {}  # phase -> ring buffer of durations (ns)
+        self._heads = {}
+        self._counts = {}
+        self._frame_start = None
+        self.trace = deque(maxlen=trace_capacity)  # (name, start_ns, duration_ns)
+
+    def phase(self, name):
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def timed(self, name=None):
+        """Decorator timing every call of the wrapped function as a phase."""
+
+        def decorator(fn):
+            label = name or fn.__qualname__
+
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                start = perf_counter_ns()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.record(label, start, perf_counter_ns() - start)
+
+            return wrapper
+
+        return decorator
+
+    def begin_frame(self):
+        self._frame_start = perf_counter_ns() if self.enabled else None
+
+    def end_frame(self):
+        start = self._frame_start
+        if start is not None and self.enabled:
+            self.record(self.FRAME, start, perf_counter_ns() - start)
+        self._frame_start = None
+
+    def record(self, name, start_ns, duration_ns):
+        buf = self.samples.get(name)
+        if buf is None:
+            buf = self.samples[name] = np.zeros(self.window, dtype=np.int64)
+            self._heads[name] = 0
+            self._counts[name] = 0
+        head = self._heads[name]
+        buf[head] = duration_ns
+        self._heads[name] = (head + 1) % self.window
+        self._counts[name] = min(self._counts[name] + 1, self.window)
+        if self.tracing:
+            self.trace.append((name, start_ns, duration_ns))
+
+    def stats(self) -> dict:
+        """{phase: {"p50", "p95", "p99", "mean"}} in milliseconds."""
+        result = {}
+        for name, buf in self.samples.items():
+            count = self._counts[name]
+            if not count:
+                continue
+            data = buf[:count] / 1e6
+            p50, p95, p99 = np.percentile(data, (50, 95, 99))
+            result[name] = {
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "mean": float(data.mean()),
+            }
+        return result
+
+    def reset(self):
+        self.samples.clear()
+        self._heads.clear()
+        self._counts.clear()
+        self.trace.clear()
+
+    def export_chrome_trace(self, path):
+        """Write recorded samples as Chrome trace JSON (chrome://tracing, Perfetto)."""
+        events = [
+            {
+                "name": name,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": duration / 1000,
+                "pid": 0,
+                "tid": 0,
+            }
+            for name, start, duration in self.trace
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
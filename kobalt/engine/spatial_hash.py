@@ -0,0 +1,91 @@
+from collections import defaultdict
+
+
+class SpatialHash:
+    """
+    Uniform grid broad-phase.
+    Every object is bucketed into each cell its bounds (x, y, w, h) touch,
+    so queries only look at objects in nearby cells.
+    """
+
+    def __init__(self, cell_size=128):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self.cells = defaultdict(set)  # (cx, cy) -> objects
+        self._ranges = {}  # object -> (cx0, cy0, cx1, cy1)
+
+    def __len__(self):
+        return len(self._ranges)
+
+    def __contains__(self, obj):
+        return obj in self._ranges
+
+    def cell_range(self, x, y, w, h):
+        cs = self.cell_size
+        # a zero-size box still occupies the cell it sits in
+        return (
+            int(x // cs),
+            int(y // cs),
+            int((x + max(w, 1) - 1) // cs),
+            int((y + max(h, 1) - 1) // cs),
+        )
+
+    def insert(self, obj, bounds):
+        cell_range = self.cell_range(*bounds)
+        self._ranges[obj] = cell_range
+        self._add_to_cells(obj, cell_range)
+
+    def remove(self, obj):
+        cell_range = self._ranges.pop(obj, None)
+        if cell_range is not None:
+            self._remove_from_cells(obj, cell_range)
+
+    def update(self, obj, bounds):
+        """Re-bucket obj, touching the grid only if its cells changed."""
+        cell_range = self.cell_range(*bounds)
+        old = self._ranges.get(obj)
+        if old == cell_range:
+            return
+        if old is not None:
+            self._remove_from_cells(obj, old)
+        self._ranges[obj] = cell_range
+        self._add_to_cells(obj, cell_range)
+
+    def query_rect(self, x, y, w, h) -> set:
+        """Objects sharing a cell with the box (candidates, not exact hits)."""
+        found = set()
+        cells = self.cells
+        cx0, cy0, cx1, cy1 = self.cell_range(x, y, w, h)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found |= cell
+        return found
+
+    def query_point(self, x, y) -> set:
+        cs = self.cell_size
+        return set(self.cells.get((int(x // cs), int(y // cs)), ()))
+
+    def clear(self):
+        self.cells.clear()
+        self._ranges.clear()
+
+    def _add_to_cells(self, obj, cell_range):
+        cx0, cy0, cx1, cy1 = cell_range
+        cells = self.cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cells[(cx, cy)].add(obj)
+
+    def _remove_from_cells(self, obj, cell_range):
+        cx0, cy0, cx1, cy1 = cell_range
+        cells = self.cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(obj)
+                    if not cell:
+                        del cells[(cx, cy)]
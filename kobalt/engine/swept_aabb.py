@@ -0,0 +1,87 @@
+from typing import NamedTuple
+
+INF = float("inf")
+# tolerance for boxes that end a step exactly touching (float round-off)
+EPSILON = 1e-6
+
+
+class Contact(NamedTuple):
+    widget: object
+    normal_x: float
+    normal_y: float
+    time: float  # fraction of the step at which the contact happened
+
+
+def sweep_aabb(x, y, w, h, dx, dy, ox, oy, ow, oh):
+    """
+    Sweep box (x, y, w, h) by (dx, dy) against the static box (ox, oy, ow, oh).
+    Returns (time, normal_x, normal_y) of the first contact within the step,
+    or None if the boxes never touch or already overlap.
+    """
+    if dx > 0:
+        x_entry, x_exit = (ox - (x + w)) / dx, (ox + ow - x) / dx
+    elif dx < 0:
+        x_entry, x_exit = (ox + ow - x) / dx, (ox - (x + w)) / dx
+    elif x + w > ox and x < ox + ow:
+        x_entry, x_exit = -INF, INF
+    else:
+        return None
+
+    if dy > 0:
+        y_entry, y_exit = (oy - (y + h)) / dy, (oy + oh - y) / dy
+    elif dy < 0:
+        y_entry, y_exit = (oy + oh - y) / dy, (oy - (y + h)) / dy
+    elif y + h > oy and y < oy + oh:
+        y_entry, y_exit = -INF, INF
+    else:
+        return None
+
+    entry = max(x_entry, y_entry)
+    exit_ = min(x_exit, y_exit)
+    if entry > exit_ or entry > 1 or entry < -EPSILON or exit_ <= 0:
+        return None
+
+    if x_entry > y_entry:
+        return max(entry, 0.0), (-1.0 if dx > 0 else 1.0), 0.0
+    return max(entry, 0.0), 0.0, (-1.0 if dy > 0 else 1.0)
+
+
+def move_and_collide(x, y, w, h, dx, dy, world, exclude=None, max_iterations=3):
+    """
+    Move box (x, y, w, h) by (dx, dy) through the widgets of a CollisionWorld,
+    stopping at the first contact and sliding along it.
+    Returns (x, y, contacts); nothing can be tunnelled through at any speed
+    since the whole displacement is swept.
+    """
+    contacts = []
+    for _ in range(max_iterations):
+        if not dx and not dy:
+            break
+        # broad phase: everything near the swept bounds
+        candidates = world.candidates(
+            min(x, x + dx), min(y, y + dy), w + abs(dx), h + abs(dy)
+        )
+        best = None
+        for other in candidates:
+            if other is exclude:
+                continue
+            hit = sweep_aabb(
+                x, y, w, h, dx, dy, other.x, other.y, other.width, other.height
+            )
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = (*hit, other)
+
+        if best is None:
+            x += dx
+            y += dy
+            break
+
+        t, nx, ny, other = best
+        x += dx * t
+        y += dy * t
+        contacts.append(Contact(other, nx, ny, t))
+        # slide: keep the remaining motion along the contact surface
+        remaining = 1.0 - t
+        dx = 0.0 if nx else dx * remaining
+        dy = 0.0 if ny else dy * remaining
+    return x, y, contacts
@@ -0,0 +1,152 @@
+import json
+import os
+import queue
+import threading
+
+import numpy as np
+
+# Player fields captured by default, with their column dtypes
+DEFAULT_FIELDS = {
+    "speed": "f8",
+    "vel_x": "f8",
+    "vel_y": "f8",
+    "on_ground": "u1",
+    "time_on_ground_ms": "f8",
+}
+
+HEADER = "header.json"
+
+
+class TelemetryRecorder:
+    """
+    Samples object fields into preallocated column chunks and streams full
+    chunks to disk from a background thread.
+
+    A recording is a directory with header.json and one append-only raw
+    column file per field (<field>.bin), readable with load_telemetry().
+    Data already flushed survives a crash; sample() never waits on disk.
+    flush_every also hands partial chunks off every that many samples, so
+    a hard kill loses at most that many instead of a whole chunk.
+    """
+
+    def __init__(
+        self, path, fields=None, chunk_size=4096, tick_rate=None, flush_every=None
+    ):
+        self.path = path
+        self.fields = {
+            name: np.dtype(dtype) for name, dtype in (fields or DEFAULT_FIELDS).items()
+        }
+        self.chunk_size = chunk_size
+        self.flush_every = flush_every
+        self.samples = 0
+        self.closed = False
+
+        os.makedirs(path, exist_ok=True)
+        header = {
+            "fields": {name: dtype.str for name, dtype in self.fields.items()},
+            "tick_rate": tick_rate,
+        }
+        with open(os.path.join(path, HEADER), "w") as f:
+            json.dump(header, f)
+        self._files = {
+            name: open(os.path.join(path, f"{name}.bin"), "ab") for name in self.fields
+        }
+
+        # chunks cycle between the game thread and the writer thread
+        self._free = queue.SimpleQueue()
+        self._full = queue.SimpleQueue()
+        for _ in range(2):
+            self._free.put(self._new_chunk())
+        self._chunk = self._new_chunk()
+        self._n = 0
+
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def sample(self, obj):
+        """Record the current value of every field on obj."""
+        n = self._n
+        chunk = self._chunk
+        for name in self.fields:
+            chunk[name][n] = getattr(obj, name)
+        self._n = n + 1
+        self.samples += 1
+        if self._n == self.chunk_size or (
+            self.flush_every and self.samples % self.flush_every == 0
+        ):
+            self._hand_off()
+
+    def flush(self):
+        """Queue the partial chunk for writing (still non-blocking)."""
+        if self._n:
+            self._hand_off()
+
+    def close(self):
+        """Flush everything and wait for the writer to finish."""
+        if self.closed:
+            return
+        self.flush()
+        self._full.put(None)
+        self._writer.join()
+        for f in self._files.values():
+            f.close()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _new_chunk(self):
+        return {
+            name: np.empty(self.chunk_size, dtype=dtype)
+            for name, dtype in self.fields.items()
+        }
+
+    def _hand_off(self):
+        self._full.put((self._chunk, self._n))
+        try:
+            self._chunk = self._free.get_nowait()
+        except queue.Empty:
+            # writer is behind: grow the pool rather than stall the game
+            self._chunk = self._new_chunk()
+        self._n = 0
+
+    def _write_loop(self):
+        while True:
+            item = self._full.get()
+            if item is None:
+                return
+            chunk, n = item
+            for name, f in self._files.items():
+                chunk[name][:n].tofile(f)
+                f.flush()
+            self._free.put(chunk)
+
+
+def load_telemetry(path, mmap=True) -> dict:
+    """
+    Columns of a recording as arrays (memory-mapped by default).
+    Columns are cut to the shortest one, in case a run died mid-write.
+    """
+    with open(os.path.join(path, HEADER)) as f:
+        header = json.load(f)
+    dtypes = {name: np.dtype(dtype) for name, dtype in header["fields"].items()}
+    files = {name: os.path.join(path, f"{name}.bin") for name in dtypes}
+    length = min(
+        (os.path.getsize(files[name]) // dtypes[name].itemsize for name in dtypes),
+        default=0,
+    )
+
+    columns = {}
+    for name, dtype in dtypes.items():
+        if length == 0:
+            columns[name] = np.empty(0, dtype=dtype)
+        elif mmap:
+            columns[name] = np.memmap(
+                files[name], dtype=dtype, mode="r", shape=(length,)
+            )
+        else:
+            columns[name] = np.fromfile(files[name], dtype=dtype, count=length)
+    return columns
@@ -0,0 +1,87 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# no display, no vsync: must be set before pygame creates any window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from engine import FixedTimestep, ReplayInput, load_replay
+from engine.input import ACTION_BITS
+from widgets import Player
+
+SIZE = (1280, 720)
+TICK_RATE = 60
+
+
+def synthetic_frames(seconds, tick_rate=TICK_RATE, jump_every=45, turn_every=240):
+    """Strafe back and forth, jumping on a fixed rhythm."""
+    frames = []
+    for tick in range(int(seconds * tick_rate)):
+        direction = "right" if (tick // turn_every) % 2 == 0 else "left"
+        mask = ACTION_BITS[direction]
+        if tick % jump_every == 0:
+            mask |= ACTION_BITS["jump"]
+        frames.append(mask)
+    return frames
+
+
+def simulate(frames, tick_rate=TICK_RATE, screen_size=SIZE, **player_kwargs):
+    """
+    Run the player through the input frames as fast as the CPU allows.
+    Returns (player, speeds) with one speed sample per tick.
+    """
+    player_kwargs.setdefault("width", 40)
+    player_kwargs.setdefault("height", 40)
+    player = Player(
+        screen_size=screen_size,
+        x=player_kwargs["width"],
+        y=screen_size[1] - player_kwargs["height"],
+        input_source=ReplayInput(frames),
+        **player_kwargs,
+    )
+    engine = FixedTimestep(tick_rate)
+    engine.add(player)
+
+    speeds = []
+    for _ in range(len(frames)):
+        engine.tick()
+        speeds.append(player.speed)
+    return player, speeds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless replay of player input.")
+    parser.add_argument("replay", nargs="?", help="replay file (JSON)")
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=1000,
+        help="length of the synthetic run when no replay is given",
+    )
+    parser.add_argument("--no-air-strafe", action="store_true")
+    args = parser.parse_args()
+
+    if args.replay:
+        frames, tick_rate = load_replay(args.replay)
+    else:
+        frames, tick_rate = synthetic_frames(args.seconds), TICK_RATE
+
+    start = time.perf_counter()
+    player, speeds = simulate(frames, tick_rate, air_strafe=not args.no_air_strafe)
+    elapsed = time.perf_counter() - start
+
+    simulated = len(frames) / tick_rate
+    print(f"ticks:      {len(frames)} ({simulated:.1f} simulated s)")
+    speedup = simulated / max(elapsed, 1e-9)
+    print(f"wall time:  {elapsed:.3f} s ({speedup:.0f}x realtime)")
+    print(f"final pos:  ({player.x:.2f}, {player.y:.2f})")
+    print(f"max speed:  {max(speeds, default=0):.3f}")
+    print(f"mean speed: {sum(speeds) / max(len(speeds), 1):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,69 +4,96 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import pygame
+from engine import (
+    Bindings,
+    DirtyRenderer,
+    Dispatcher,
+    FixedTimestep,
+    KeyboardInput,
+)
 from widgets import Player
 
-from libs.winmode import PygameWindowController, WindowStates
+from libs.winmode import PygameWindowController, RenderTarget, WindowStates
 
 BLUE = (0, 0, 255)
 
 SIZE = (1280, 720)
 FPS = 60
+TICK_RATE = 60  # physics ticks per second, independent of FPS
 
 
 def main():
     pygame.init()
     pygame.mouse.set_visible(False)
 
-    controller = PygameWindowController(SIZE, WindowStates.WINDOWED_STATELESS)
+    # the game always draws on a SIZE canvas, scaled to the window
+    controller = PygameWindowController(
+        SIZE,
+        WindowStates.WINDOWED_STATELESS,
+        render_target=RenderTarget(SIZE, scale_mode="fit"),
+    )
     screen = controller.get_screen()
     clock = pygame.time.Clock()
     running = True
 
     w, h = screen.get_size()
 
+    # input: rebindable actions, keys polled once per tick
+    bindings = Bindings()
+    input_source = KeyboardInput(bindings)
+
     # player
     player_w = 40
     player_h = 40
     player = Player(
-        player_w,
-        player_h,
+        screen_size=SIZE,
+        x=w // 2 - player_w // 2,
+        y=h - player_h,
+        width=player_w,
+        height=player_h,
         color=BLUE,
-        fps=FPS,
-        pos=(w // 2 - player_w // 2, h - player_h),
-        speed=200,
+        input_source=input_source,
     )
 
+    # fixed-timestep physics
+    engine = FixedTimestep(TICK_RATE)
+    # only redraw and present what changed
+    renderer = DirtyRenderer(present=controller.present)
+    controller.add_screen_listener(lambda screen: renderer.invalidate())
+    engine.add(player)
+
+    def quit_game(event):
+        nonlocal running
+        running = False
+
+    # events are routed by type and bound action, no if-chains
+    dispatcher = Dispatcher(bindings)
+    dispatcher.on_event(pygame.QUIT, quit_game)
+    dispatcher.on_action("quit", quit_game)
+    # queued: applied once per frame, repeats coalesce
+    dispatcher.on_action("fullscreen", lambda event: controller.toggle_fullscreen())
+    # monitor geometry is re-queried only after display changes
+    dispatcher.on_any(controller.handle_display_event)
+    # jump presses are buffered for the next tick
+    dispatcher.on_event(pygame.KEYDOWN, player.handle_event)
+
     while running:
         # events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-                if event.key == pygame.K_F11:
-                    controller.set_mode(
-                        WindowStates.WINDOWED_STATELESS
-                        if controller.is_current_fullscreen_mode()
-                        else WindowStates.FULLSCREEN
-                    )
-                    w, h = screen.get_size()
-                    player.update_position((w, h))
-
-                player.handle_event(event)
+        dispatcher.process()
+
+        # at most one display change per frame, before anything is drawn
+        controller.apply_pending()
 
         # drawing / updating
-        dt = clock.tick(FPS) / 1000
+        engine.advance(clock.tick(FPS) / 1000)
         screen = controller.get_screen()
-        screen.fill((0, 0, 0))
+        renderer.begin(screen)
 
         # player
-        player.update(dt, screen)
-        player.draw(screen)
+        renderer.add(player.render(screen, engine.alpha))
 
-        # display update
-        pygame.display.update()
+        # display update (dirty rects only)
+        renderer.end()
 
     pygame.quit()
 
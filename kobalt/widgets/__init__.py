@@ -1,3 +1,7 @@
+from .graph import Graph
+from .particles import ParticleEmitter
 from .player import Player
+from .profiler_overlay import ProfilerOverlay
+from .text import GlyphAtlas, Text, get_font
 from .trail import Trail
 from .widget import Widget
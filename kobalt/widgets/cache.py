@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class LRUCache:
+    """Small least-recently-used mapping with a fixed number of entries."""
+
+    def __init__(self, maxsize=128):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        try:
+            value = self._data[key]
+        except KeyError:
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def get_or_create(self, key, factory):
+        """Return the cached value for key, building it with factory() on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def discard(self, key):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+
+class StampCache(LRUCache):
+    """Solid SRCALPHA rectangles keyed by (width, height, color, alpha)."""
+
+    def get_stamp(self, width, height, color, alpha) -> pygame.Surface:
+        key = (width, height, color, alpha)
+        stamp = self.get(key)
+        if stamp is None:
+            stamp = pygame.Surface((width, height), pygame.SRCALPHA)
+            stamp.fill((*color, alpha))
+            self.put(key, stamp)
+        return stamp
@@ -0,0 +1,123 @@
+import numpy as np
+import pygame
+
+from .widget import Widget
+
+
+class Graph(Widget):
+    """
+    Scrolling line graph of one value, one pixel column per sample.
+    Samples live in a ring buffer as wide as the graph; each push scrolls
+    the cached surface left by a column and draws only the newest segment,
+    so the per-sample cost does not depend on how much history is shown.
+    """
+
+    __slots__ = (
+        "source",
+        "min_value",
+        "max_value",
+        "auto_range",
+        "background",
+        "visible",
+        "values",
+        "surface",
+        "_head",
+        "_count",
+    )
+
+    def __init__(
+        self,
+        screen_size,
+        x=0,
+        y=0,
+        width=240,
+        height=80,
+        color=(255, 255, 0),
+        background=(20, 20, 20),
+        min_value=0.0,
+        max_value=None,
+        source=None,
+    ):
+        super().__init__(screen_size, x, y, width, height, color)
+        self.background = background
+        self.min_value = min_value
+        # None: grow the range to fit the largest sample seen
+        self.auto_range = max_value is None
+        self.max_value = max_value if max_value is not None else min_value + 1.0
+        # callable returning the value to plot, used by sample()
+        self.source = source
+        self.visible = True
+        self._reset_buffer()
+
+    def _reset_buffer(self):
+        self.values = np.zeros(max(1, int(self.width)))
+        self._head = 0
+        self._count = 0
+        self.surface = pygame.Surface((int(self.width), int(self.height)))
+        self.surface.fill(self.background)
+
+    def sample(self):
+        """Push the current value of source()."""
+        self.push(self.source())
+
+    def push(self, value):
+        value = float(value)
+        capacity = len(self.values)
+        self.values[self._head] = value
+        self._head = (self._head + 1) % capacity
+        self._count = min(self._count + 1, capacity)
+
+        if self.auto_range and value > self.max_value:
+            # range changed: every column has to be redrawn (rare)
+            self.max_value = value * 1.25
+            self.redraw()
+            return
+
+        surf = self.surface
+        w, h = surf.get_size()
+        surf.scroll(-1, 0)
+        surf.fill(self.background, (w - 1, 0, 1, h))
+        if self._count > 1:
+            prev = self.values[(self._head - 2) % capacity]
+            pygame.draw.line(
+                surf, self.color, (w - 2, self._to_y(prev)), (w - 1, self._to_y(value))
+            )
+        else:
+            surf.set_at((w - 1, self._to_y(value)), self.color)
+
+    def redraw(self):
+        """Draw the whole history again (only needed after a range change)."""
+        surf = self.surface
+        w, _ = surf.get_size()
+        surf.fill(self.background)
+        n = self._count
+        if n == 0:
+            return
+        idx = (np.arange(self._head - n, self._head)) % len(self.values)
+        ys = [self._to_y(v) for v in self.values[idx].tolist()]
+        xs = range(w - n, w)
+        if n == 1:
+            surf.set_at((w - 1, ys[0]), self.color)
+        else:
+            pygame.draw.lines(surf, self.color, False, list(zip(xs, ys)))
+
+    def _to_y(self, value) -> int:
+        h = self.surface.get_height()
+        span = self.max_value - self.min_value or 1.0
+        t = (value - self.min_value) / span
+        return int(round((h - 1) * (1.0 - min(max(t, 0.0), 1.0))))
+
+    def set_size(self, width, height):
+        super().set_size(width, height)
+        self._reset_buffer()
+
+    def clear(self):
+        self._reset_buffer()
+
+    def render(self, surface: pygame.Surface, alpha=1.0) -> pygame.Rect | None:
+        if not self.visible:
+            return None
+        return surface.blit(self.surface, (self.x, self.y))
+
+    def handle_event(self, event):
+        pass
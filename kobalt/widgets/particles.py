@@ -0,0 +1,198 @@
+import math
+import time
+
+import numpy as np
+import pygame
+
+from .cache import StampCache
+from .widget import Widget
+
+
+class ParticleEmitter(Widget):
+    """
+    Pooled particle system (dust, bursts, sparks).
+    Particles live in preallocated NumPy columns and are integrated in one
+    vectorized step per tick; drawing reuses alpha stamps like Trail and
+    submits them in a single blits() call.
+
+    With frame_budget_ms set, draw time is watched and `quality` (0..1)
+    scales emission down when over budget, so effects thin out instead of
+    the frame rate dropping. Emits that find the pool full are dropped.
+    """
+
+    __slots__ = (
+        "capacity",
+        "lifetime",
+        "gravity",
+        "drag",
+        "max_alpha",
+        "alpha_step",
+        "frame_budget_ms",
+        "min_quality",
+        "quality",
+        "dropped",
+        "rng",
+        "stamps",
+        "px",
+        "py",
+        "vx",
+        "vy",
+        "age",
+        "alive",
+        "size",
+        "pcolor",
+    )
+
+    def __init__(
+        self,
+        screen_size,
+        color=(255, 255, 255),
+        capacity=10_000,
+        size=4,
+        gravity=900.0,  # px/s^2
+        drag=0.0,  # fraction of velocity lost per second
+        max_alpha=255,
+        alpha_step=8,
+        frame_budget_ms=None,
+        min_quality=0.1,
+        stamp_cache_size=256,
+        seed=None,
+    ):
+        super().__init__(screen_size, 0, 0, size, size, color)
+        self.capacity = capacity
+        self.gravity = gravity
+        self.drag = drag
+        self.max_alpha = max_alpha
+        self.alpha_step = max(1, alpha_step)
+        self.frame_budget_ms = frame_budget_ms
+        self.min_quality = min_quality
+        self.quality = 1.0
+        self.dropped = 0  # particles refused because the pool was full
+        self.stamps = StampCache(stamp_cache_size)
+        self.rng = np.random.default_rng(seed)
+
+        # pool
+        self.px = np.zeros(capacity)
+        self.py = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.age = np.zeros(capacity)
+        self.lifetime = np.ones(capacity)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.pcolor = np.zeros((capacity, 3), dtype=np.uint8)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def emit(
+        self,
+        x,
+        y,
+        count,
+        speed=(50.0, 200.0),
+        angle=(0.0, 2 * math.pi),
+        lifetime=(0.3, 0.8),
+        size=None,
+        color=None,
+    ) -> int:
+        """
+        Spawn up to count particles at (x, y); returns how many were spawned.
+        Angles are in radians with pi/2 pointing up, ranges are (low, high).
+        """
+        count = int(count * self.quality)
+        if count <= 0:
+            return 0
+        free = np.flatnonzero(~self.alive)[:count]
+        self.dropped += count - len(free)
+        n = len(free)
+        if n == 0:
+            return 0
+
+        rng = self.rng
+        theta = rng.uniform(angle[0], angle[1], n)
+        v = rng.uniform(speed[0], speed[1], n)
+        self.px[free] = x
+        self.py[free] = y
+        self.vx[free] = np.cos(theta) * v
+        self.vy[free] = -np.sin(theta) * v
+        self.age[free] = 0.0
+        self.lifetime[free] = rng.uniform(lifetime[0], lifetime[1], n)
+        self.size[free] = int(size if size is not None else self.width)
+        self.pcolor[free] = (color or self.color)[:3]
+        self.alive[free] = True
+        return n
+
+    def clear(self):
+        self.alive[:] = False
+
+    def _update(self, dt):
+        # whole-pool arithmetic: cheaper than gathering the live subset
+        if self.drag:
+            damping = max(0.0, 1.0 - self.drag * dt)
+            self.vx *= damping
+            self.vy *= damping
+        self.vy += self.gravity * dt
+        self.px += self.vx * dt
+        self.py += self.vy * dt
+        self.age += dt
+        self.alive &= self.age < self.lifetime
+
+    def render(
+        self, surface: pygame.Surface, alpha=1.0, offset=(0, 0)
+    ) -> pygame.Rect | None:
+        start = time.perf_counter()
+        # live particles on screen after the offset, culled before any stamps
+        ox, oy = offset
+        sw, sh = surface.get_size()
+        px, py = self.px - ox, self.py - oy
+        size = self.size
+        on_screen = (px < sw) & (py < sh) & (px + size > 0) & (py + size > 0)
+        idx = np.flatnonzero(self.alive & on_screen)
+        if not len(idx):
+            return None
+
+        fade = 1.0 - self.age[idx] / self.lifetime[idx]
+        alphas = (self.max_alpha * fade).astype(np.int32)
+        alphas -= alphas % self.alpha_step
+        sizes = self.size[idx]
+        xs = px[idx]
+        ys = py[idx]
+
+        # look each distinct stamp up once, then fan it out per particle
+        colors = self.pcolor[idx].astype(np.int64)
+        keys = (
+            (sizes.astype(np.int64) << 32)
+            | (colors[:, 0] << 24)
+            | (colors[:, 1] << 16)
+            | (colors[:, 2] << 8)
+            | alphas
+        )
+        unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        get_stamp = self.stamps.get_stamp
+        stamps = np.empty(len(unique), dtype=object)
+        for i, j in enumerate(first.tolist()):
+            stamps[i] = get_stamp(
+                int(sizes[j]), int(sizes[j]), tuple(colors[j].tolist()), int(alphas[j])
+            )
+        surface.blits(
+            zip(stamps[inverse].tolist(), zip(xs.tolist(), ys.tolist())),
+            doreturn=False,
+        )
+
+        if self.frame_budget_ms:
+            self._adapt_quality((time.perf_counter() - start) * 1000)
+
+        left, top = float(xs.min()), float(ys.min())
+        right = float((xs + sizes).max())
+        bottom = float((ys + sizes).max())
+        return pygame.Rect(left, top, right - left + 1, bottom - top + 1)
+
+    def _adapt_quality(self, elapsed_ms):
+        if elapsed_ms > self.frame_budget_ms:
+            self.quality = max(self.min_quality, self.quality * 0.85)
+        elif elapsed_ms < self.frame_budget_ms * 0.5:
+            self.quality = min(1.0, self.quality * 1.05)
+
+    def handle_event(self, event):
+        pass
@@ -2,13 +2,40 @@ import pygame
 
 from .widget import Widget
 
+# keys used without an input source
+JUMP_KEYS = frozenset((pygame.K_SPACE, pygame.K_UP))
+
 
 class Player(Widget):
     """
     Simple controllable player built on Widget.
     Uses key state for left/right movement and event for jump.
+    Movement constants are in units per reference tick (1 / REFERENCE_FPS s)
+    and are scaled by dt, so any fixed tick rate gives the same motion.
     """
 
+    __slots__ = (
+        "collision_world",
+        "input_source",
+        "wrap",
+        "speed",
+        "old_speed",
+        "max_speed",
+        "jump_height",
+        "gravity",
+        "air_strafe",
+        "air_strafe_grow",
+        "air_strafe_decay",
+        "air_strafe_ground_threshold_ms",
+        "vel_x",
+        "vel_y",
+        "on_ground",
+        "time_on_ground_ms",
+        "contacts",
+    )
+
+    REFERENCE_FPS = 60
+
     def __init__(
         self,
         screen_size=(1280, 720),
@@ -26,6 +53,9 @@ class Player(Widget):
         air_strafe_decay: float | None = None,
         max_speed: int | None = None,
         air_strafe_ground_threshold_ms: int = 100,
+        collision_world=None,
+        input_source=None,
+        wrap: bool = True,
     ):
         super().__init__(screen_size, x, y, width, height, color, image)
 
@@ -55,27 +85,42 @@ class Player(Widget):
         self.vel_y = 0
         self.on_ground = False
 
-    def draw(self, surface: pygame.Surface, dt):
-        self._update(dt)
+        # static geometry (CollisionWorld) resolved with swept AABB
+        self.collision_world = collision_world
+        self.contacts = []  # contacts from the last step
 
-        # draw
-        if self.image:
-            img = pygame.transform.scale(self.image, (self.width, self.height))
-            surface.blit(img, (self.x, self.y))
-        else:
-            pygame.draw.rect(surface, self.color, self.rect)
+        # engine InputSource; None reads the live keyboard directly
+        self.input_source = input_source
+
+        # loop around the sides of screen_size, or stop at them (a world
+        # larger than the window, seen through a camera)
+        self.wrap = wrap
 
     def handle_event(self, event: pygame.event.Event):
-        if (event.key in [pygame.K_SPACE, pygame.K_UP]) and self.on_ground:
-            self.vel_y = -self.jump_height
-            self.on_ground = False
-            # leaving ground: reset ground timer
-            self.time_on_ground_ms = 0
+        if self.input_source is not None:
+            # presses are buffered and applied on the next tick
+            self.input_source.handle_event(event)
+        elif event.type == pygame.KEYDOWN and event.key in JUMP_KEYS:
+            self.jump()
+
+    def jump(self):
+        if not self.on_ground:
+            return
+        self.vel_y = -self.jump_height
+        self.on_ground = False
+        # leaving ground: reset ground timer
+        self.time_on_ground_ms = 0
 
     def _update(self, dt):
-        self._handle_horizontal_movement()
-        self._apply_gravity()
-        self._move()
+        # number of reference ticks this step covers
+        k = dt * self.REFERENCE_FPS
+        if self.input_source is not None:
+            self.input_source.begin_tick()
+            if self.input_source.consume("jump"):
+                self.jump()
+        self._handle_horizontal_movement(k)
+        self._apply_gravity(k)
+        self._move(k)
         self._check_vertical_bounds()
         # track time spent on ground (ms)
         if self.on_ground:
@@ -83,10 +128,14 @@ class Player(Widget):
         else:
             self.time_on_ground_ms = 0
 
-    def _handle_horizontal_movement(self):
-        keys = pygame.key.get_pressed()
-        going_left = keys[pygame.K_LEFT] or keys[pygame.K_a]
-        going_right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
+    def _handle_horizontal_movement(self, k=1.0):
+        if self.input_source is not None:
+            going_left = self.input_source.is_held("left")
+            going_right = self.input_source.is_held("right")
+        else:
+            keys = pygame.key.get_pressed()
+            going_left = keys[pygame.K_LEFT] or keys[pygame.K_a]
+            going_right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
 
         # direction: -1 (left), 0 (none or both), +1 (right)
         dirx = int(going_right) - int(going_left)
@@ -97,25 +146,41 @@ class Player(Widget):
             return
 
         if dirx != 0 and self.time_on_ground_ms < self.air_strafe_ground_threshold_ms:
-            self._grow_air_strafe()
+            self._grow_air_strafe(k)
         else:
-            self._decay_air_strafe()
+            self._decay_air_strafe(k)
 
-    def _grow_air_strafe(self):
-        self.speed = min(self.speed + self.air_strafe_grow, self.max_speed)
+    def _grow_air_strafe(self, k=1.0):
+        self.speed = min(self.speed + self.air_strafe_grow * k, self.max_speed)
 
-    def _decay_air_strafe(self):
+    def _decay_air_strafe(self, k=1.0):
         self.speed = max(
-            self.speed * self.air_strafe_decay,
+            self.speed * self.air_strafe_decay**k,
             self.old_speed,
         )
 
-    def _apply_gravity(self):
-        self.vel_y += self.gravity
+    def _apply_gravity(self, k=1.0):
+        self.vel_y += self.gravity * k
+
+    def _move(self, k=1.0):
+        dx = self.vel_x * k
+        dy = self.vel_y * k
+        # grounded again only if something stops the fall this step
+        self.on_ground = False
+        if self.collision_world is None:
+            self.x += dx
+            self.y += dy
+            return
 
-    def _move(self):
-        self.x += self.vel_x
-        self.y += self.vel_y
+        x, y, self.contacts = self.collision_world.sweep(self, dx, dy)
+        self.x = x
+        self.y = y
+        for contact in self.contacts:
+            if contact.normal_y < 0:  # landed on top
+                self.on_ground = True
+                self.vel_y = 0
+            elif contact.normal_y > 0:  # bumped a ceiling
+                self.vel_y = 0
 
     def _check_vertical_bounds(self):
         w, h = self.screen_size
@@ -125,8 +190,16 @@ class Player(Widget):
             self.y = h - self.height
             self.vel_y = 0
             self.on_ground = True
+        if not self.wrap:
+            if self.x < 0:
+                self.x = 0
+            elif self.x + self.width > w:
+                self.x = w - self.width
+            return
         # make the sides loop
         if self.x > w:  # right side loop
             self.x = -self.width
+            self.snap_prev_position()
         if self.x < -self.width:  # left side loop
             self.x = w
+            self.snap_prev_position()
@@ -0,0 +1,85 @@
+import pygame
+
+from .text import render_text
+from .widget import Widget
+
+
+class ProfilerOverlay(Widget):
+    """
+    On-screen table of an engine Profiler's per-phase p50/p95/p99.
+    The table is re-rendered every `refresh_frames` frames only, the
+    cached surface is blitted in between. Showing the overlay turns the
+    profiler on if it was off; hiding it only turns it back off, recorded
+    samples and traces are left alone.
+    """
+
+    __slots__ = (
+        "profiler",
+        "font",
+        "background",
+        "refresh_frames",
+        "visible",
+        "_frames",
+        "_surface",
+        "_enabled_profiler",
+    )
+
+    def __init__(
+        self,
+        screen_size,
+        profiler,
+        font: pygame.font.Font,
+        x=10,
+        y=10,
+        color=(230, 230, 230),
+        background=(0, 0, 0, 180),
+        refresh_frames=15,
+    ):
+        super().__init__(screen_size, x, y, 1, 1, color)
+        self.profiler = profiler
+        self.font = font
+        self.background = background
+        self.refresh_frames = refresh_frames
+        self._frames = 0
+        self._surface = None
+        self.visible = False
+        self._enabled_profiler = False  # profiler was off until we were shown
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._surface = None
+        if self.visible and not self.profiler.enabled:
+            self.profiler.enabled = True
+            self._enabled_profiler = True
+        elif not self.visible and self._enabled_profiler:
+            self.profiler.enabled = False
+            self._enabled_profiler = False
+
+    def _rebuild(self):
+        stats = self.profiler.stats()
+        lines = [f"{'phase':<12}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name, s in sorted(stats.items(), key=lambda item: -item[1]["p50"]):
+            lines.append(
+                f"{name[:12]:<12}{s['p50']:>7.2f}{s['p95']:>7.2f}{s['p99']:>7.2f}"
+            )
+        rows = [render_text(self.font, line, True, self.color) for line in lines]
+        width = max(row.get_width() for row in rows) + 12
+        line_h = self.font.get_linesize()
+        surf = pygame.Surface((width, line_h * len(rows) + 12), pygame.SRCALPHA)
+        surf.fill(self.background)
+        surf.blits(
+            [(row, (6, 6 + i * line_h)) for i, row in enumerate(rows)], doreturn=False
+        )
+        self._surface = surf
+        self.set_size(*surf.get_size())
+
+    def render(self, surface: pygame.Surface, alpha=1.0) -> pygame.Rect | None:
+        if not self.visible:
+            return None
+        if self._surface is None or self._frames % self.refresh_frames == 0:
+            self._rebuild()
+        self._frames += 1
+        return surface.blit(self._surface, (self.x, self.y))
+
+    def handle_event(self, event):
+        pass
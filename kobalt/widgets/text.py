@@ -0,0 +1,191 @@
+import json
+import os
+from functools import lru_cache
+
+import pygame
+
+from .cache import LRUCache
+from .widget import Widget
+
+DIGITS = "0123456789.-+ "
+
+# rendered strings shared by every Text, keyed by (text, color, antialias, font)
+_text_cache = LRUCache(256)
+# glyph atlases keyed by (font, color, antialias, charset)
+_atlas_cache = LRUCache(32)
+
+# resolved system font paths for this process; opt in to keeping them across
+# runs (startup then skips the font scan) by naming a file in this variable
+FONT_CACHE_ENV = "KOBALT_FONT_CACHE"
+_font_paths = None
+
+
+@lru_cache(maxsize=None)
+def get_font(name, size, bold=False, italic=False) -> pygame.font.Font:
+    """
+    Cached stand-in for pygame.font.SysFont.
+    The font file path is looked up once per process. With KOBALT_FONT_CACHE
+    set to a file, paths are also kept there, so later runs open the file
+    directly without scanning system fonts.
+    """
+    key = f"{name}|{int(bold)}|{int(italic)}"
+    paths = _load_font_paths()
+    path = paths.get(key)
+    if path is None or (path and not os.path.exists(path)):
+        path = pygame.font.match_font(name, bold, italic) or ""
+        paths[key] = path
+        _save_font_paths(paths)
+    # an empty path means no match: pygame's default font, like SysFont
+    font = pygame.font.Font(path or None, size)
+    if not path:
+        font.set_bold(bold)
+        font.set_italic(italic)
+    return font
+
+
+def _load_font_paths() -> dict:
+    global _font_paths
+    if _font_paths is None:
+        _font_paths = {}
+        path = os.environ.get(FONT_CACHE_ENV)
+        if path:
+            try:
+                with open(path) as f:
+                    _font_paths = json.load(f)
+            except (OSError, ValueError):
+                pass
+    return _font_paths
+
+
+def _save_font_paths(paths):
+    path = os.environ.get(FONT_CACHE_ENV)
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(paths, f)
+    except OSError:
+        pass  # cache is best effort
+
+
+def render_text(font: pygame.font.Font, text, antialias, color) -> pygame.Surface:
+    """font.render with an LRU cache in front of it."""
+    key = (text, tuple(color), antialias, font)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = font.render(text, antialias, color)
+        _text_cache.put(key, surf)
+    return surf
+
+
+class GlyphAtlas:
+    """
+    Pre-rendered glyphs for a small charset (digits by default).
+    Strings made only of those glyphs are composed with one blits() call
+    instead of being rasterized again.
+    """
+
+    def __init__(self, font: pygame.font.Font, color, antialias=True, charset=DIGITS):
+        self.font = font
+        self.color = tuple(color)
+        self.antialias = antialias
+        self.charset = frozenset(charset)
+        self.glyphs = {ch: font.render(ch, antialias, color) for ch in charset}
+        self.height = font.get_height()
+
+    @classmethod
+    def get(cls, font, color, antialias=True, charset=DIGITS) -> "GlyphAtlas":
+        key = (font, tuple(color), antialias, charset)
+        atlas = _atlas_cache.get(key)
+        if atlas is None:
+            atlas = cls(font, color, antialias, charset)
+            _atlas_cache.put(key, atlas)
+        return atlas
+
+    def covers(self, text) -> bool:
+        return self.charset.issuperset(text)
+
+    def size(self, text):
+        glyphs = self.glyphs
+        return sum(glyphs[ch].get_width() for ch in text), self.height
+
+    def blit(self, surface: pygame.Surface, text, pos) -> pygame.Rect:
+        x, y = pos
+        seq = []
+        for ch in text:
+            glyph = self.glyphs[ch]
+            seq.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.blits(seq, doreturn=False)
+        return pygame.Rect(pos[0], pos[1], x - pos[0], self.height)
+
+
+class Text(Widget):
+    """
+    Single line of HUD text.
+    Rendered strings come from a shared LRU cache; with glyph_atlas=True
+    numeric text is composed from pre-rendered glyphs instead.
+    """
+
+    __slots__ = (
+        "font",
+        "text",
+        "antialias",
+        "charset",
+        "atlas",
+    )
+
+    def __init__(
+        self,
+        screen_size,
+        font: pygame.font.Font,
+        text="",
+        x=0,
+        y=0,
+        color=(255, 255, 255),
+        antialias=True,
+        glyph_atlas=False,
+        charset=DIGITS,
+    ):
+        super().__init__(screen_size, x, y, 0, 0, color)
+        self.font = font
+        self.antialias = antialias
+        self.charset = charset
+        self.atlas = None
+        if glyph_atlas:
+            self.atlas = GlyphAtlas.get(font, color, antialias, charset)
+        self.text = None
+        self.set_text(text)
+
+    def set_text(self, text):
+        text = str(text)
+        if text == self.text:
+            return
+        self.text = text
+        if self.atlas is not None and self.atlas.covers(text):
+            size = self.atlas.size(text)
+        else:
+            size = self.font.size(text)
+        if size != (self._width, self._height):
+            self.set_size(*size)
+
+    def set_color(self, color):
+        if color == self.color:
+            return
+        super().set_color(color)
+        if self.atlas is not None:
+            self.atlas = GlyphAtlas.get(self.font, color, self.antialias, self.charset)
+
+    def get_surface(self) -> pygame.Surface:
+        return render_text(self.font, self.text, self.antialias, self.color)
+
+    def render(self, surface: pygame.Surface, alpha=1.0) -> pygame.Rect | None:
+        if not self.text:
+            return None
+        if self.atlas is not None and self.atlas.covers(self.text):
+            return self.atlas.blit(surface, self.text, (self.x, self.y))
+        return surface.blit(self.get_surface(), (self.x, self.y))
+
+    def handle_event(self, event):
+        pass
@@ -0,0 +1,79 @@
+import numpy as np
+
+
+class TrackBuffer:
+    """
+    Fixed-capacity ring buffer of trail tracks stored as columns.
+    Appends are O(1), eviction pops expired tracks from the tail and the
+    memory used never grows past `capacity` tracks.
+    """
+
+    def __init__(self, capacity=1024):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.t = np.zeros(capacity, dtype=np.int64)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.width = np.zeros(capacity, dtype=np.float64)
+        self.height = np.zeros(capacity, dtype=np.float64)
+        self.lifetime = np.zeros(capacity, dtype=np.int64)
+        self.max_alpha = np.zeros(capacity, dtype=np.int32)
+        self.min_alpha = np.zeros(capacity, dtype=np.int32)
+        self._head = 0  # next write slot
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def tail(self) -> int:
+        """Slot of the oldest track."""
+        return (self._head - self._count) % self.capacity
+
+    def append(self, x, y, t, color, width, height, lifetime, max_alpha, min_alpha):
+        i = self._head
+        self.x[i] = x
+        self.y[i] = y
+        self.t[i] = t
+        self.color[i] = color[:3]
+        self.width[i] = width
+        self.height[i] = height
+        self.lifetime[i] = lifetime
+        self.max_alpha[i] = max_alpha
+        self.min_alpha[i] = min_alpha
+        self._head = (i + 1) % self.capacity
+        # when full the oldest track is overwritten
+        self._count = min(self._count + 1, self.capacity)
+
+    def evict_expired(self, now) -> int:
+        """Drop expired tracks from the tail, returns how many were dropped."""
+        dropped = 0
+        while self._count:
+            i = self.tail
+            if now - self.t[i] < self.lifetime[i]:
+                break
+            self._count -= 1
+            dropped += 1
+        return dropped
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+    def indices(self) -> np.ndarray:
+        """Slots of the stored tracks, oldest first."""
+        return (np.arange(self._count) + self.tail) % self.capacity
+
+    def bounds(self):
+        """(x, y, w, h) box around every stored track, None when empty."""
+        if not self._count:
+            return None
+        idx = self.indices()
+        x = self.x[idx]
+        y = self.y[idx]
+        left, top = float(x.min()), float(y.min())
+        right = float((x + self.width[idx]).max())
+        bottom = float((y + self.height[idx]).max())
+        return left, top, right - left, bottom - top
@@ -1,9 +1,22 @@
+import numpy as np
 import pygame
 
+from .cache import StampCache
+from .track_buffer import TrackBuffer
 from .widget import Widget
 
 
 class Trail(Widget):
+    __slots__ = (
+        "lifetime",
+        "max_alpha",
+        "min_alpha",
+        "buffer",
+        "batched",
+        "alpha_step",
+        "stamps",
+    )
+
     def __init__(
         self,
         screen_size,
@@ -13,48 +26,136 @@ class Trail(Widget):
         lifetime=3000,
         max_alpha=255,
         min_alpha=0,
+        capacity=1024,
+        batched=True,
+        alpha_step=4,
+        stamp_cache_size=512,
     ):
         super().__init__(screen_size, 0, 0, width, height, color)
         self.lifetime = lifetime  # ms
         self.max_alpha = max_alpha
         self.min_alpha = min_alpha
-        self.tracks = []  # (x, y, timestamp)
+        # bounded storage, the oldest tracks get overwritten once full
+        self.buffer = TrackBuffer(capacity)
+        # batched drawing reuses alpha stamps keyed by (w, h, color, alpha)
+        self.batched = batched
+        self.alpha_step = max(1, alpha_step)
+        self.stamps = StampCache(stamp_cache_size)
 
-    def update_tracks(self, x, y):
+    @property
+    def tracks(self):
+        """Live tracks as dicts, oldest first (slow, for inspection only)."""
+        b = self.buffer
         now = pygame.time.get_ticks()
-        # stores all current params with each track
-        self.tracks.append(
+        return [
             {
-                "x": x,
-                "y": y,
-                "t": now,
-                "color": self.color,
-                "width": self.width,
-                "height": self.height,
-                "lifetime": self.lifetime,
-                "max_alpha": self.max_alpha,
-                "min_alpha": self.min_alpha,
+                "x": float(b.x[i]),
+                "y": float(b.y[i]),
+                "t": int(b.t[i]),
+                "color": tuple(int(c) for c in b.color[i]),
+                "width": float(b.width[i]),
+                "height": float(b.height[i]),
+                "lifetime": int(b.lifetime[i]),
+                "max_alpha": int(b.max_alpha[i]),
+                "min_alpha": int(b.min_alpha[i]),
             }
-        )
-        # remove old tracks (using each track lifetime)
-        self.tracks = [
-            track for track in self.tracks if now - track["t"] < track["lifetime"]
+            for i in b.indices()
+            if now - b.t[i] < b.lifetime[i]
         ]
 
-    def draw(self, surf: pygame.Surface, x, y):
+    def update_tracks(self, x, y):
+        now = pygame.time.get_ticks()
+        # stores all current params with each track
+        self.buffer.append(
+            x,
+            y,
+            now,
+            self.color,
+            self.width,
+            self.height,
+            self.lifetime,
+            self.max_alpha,
+            self.min_alpha,
+        )
+        # remove old tracks from the tail
+        self.buffer.evict_expired(now)
+
+    def draw(self, surf: pygame.Surface, x, y, offset=(0, 0)) -> pygame.Rect | None:
+        """
+        Add a track at (x, y) and draw; returns the area touched.
+        Tracks are kept in world space, offset is a camera's view top-left.
+        """
         self.update_tracks(x, y)
+        if self.batched:
+            self._draw_batched(surf, offset)
+        else:
+            self._draw_per_track(surf, offset)
+        bounds = self.buffer.bounds()
+        if not bounds:
+            return None
+        rect = pygame.Rect(bounds).move(-offset[0], -offset[1])
+        return rect.clip(surf.get_rect()) or None
+
+    def _draw_batched(self, surf: pygame.Surface, offset=(0, 0)):
+        now = pygame.time.get_ticks()
+        b = self.buffer
+        idx = b.indices()
+        age = now - b.t[idx]
+        lifetime = b.lifetime[idx]
+        # a newer track with a shorter lifetime can expire before the tail
+        live = age < lifetime
+        # cull tracks outside the surface before any alpha or stamp work
+        ox, oy = offset
+        sw, sh = surf.get_size()
+        xs = b.x[idx] - ox
+        ys = b.y[idx] - oy
+        live &= (xs < sw) & (ys < sh)
+        live &= (xs + b.width[idx] > 0) & (ys + b.height[idx] > 0)
+        idx, age, lifetime = idx[live], age[live], lifetime[live]
+        xs, ys = xs[live], ys[live]
+        if not len(idx):
+            return
+
+        max_alpha = b.max_alpha[idx]
+        min_alpha = b.min_alpha[idx]
+        alpha = max_alpha - (max_alpha * (age / lifetime)).astype(np.int32)
+        alpha -= alpha % self.alpha_step
+        # quantizing rounds down, never past the floor
+        alpha = np.maximum(min_alpha, alpha)
+
+        get_stamp = self.stamps.get_stamp
+        surf.blits(
+            [
+                (get_stamp(w, h, tuple(c), a), (px, py))
+                for w, h, c, a, px, py in zip(
+                    b.width[idx].astype(np.int32).tolist(),
+                    b.height[idx].astype(np.int32).tolist(),
+                    b.color[idx].tolist(),
+                    alpha.tolist(),
+                    xs.tolist(),
+                    ys.tolist(),
+                )
+            ],
+            doreturn=False,
+        )
+
+    def _draw_per_track(self, surf: pygame.Surface, offset=(0, 0)):
         now = pygame.time.get_ticks()
-        for track in self.tracks:
-            age = now - track["t"]
+        b = self.buffer
+        for i in b.indices():
+            age = now - int(b.t[i])
+            lifetime = int(b.lifetime[i])
+            if age >= lifetime:
+                continue
+            max_alpha = int(b.max_alpha[i])
             # start at max_alpha and fade to min_alpha as age -> lifetime
             alpha = max(
-                track["min_alpha"],
-                track["max_alpha"]
-                - int(track["max_alpha"] * (age / track["lifetime"])),
+                int(b.min_alpha[i]),
+                max_alpha - int(max_alpha * (age / lifetime)),
             )  # max - max * (age / lifetime) as (age / lifetime) starts at 1 -> min_alpha
-            s = pygame.Surface((track["width"], track["height"]), pygame.SRCALPHA)
-            s.fill((*track["color"], alpha))
-            surf.blit(s, (track["x"], track["y"]))
+            s = pygame.Surface((b.width[i], b.height[i]), pygame.SRCALPHA)
+            s.fill((*b.color[i].tolist(), alpha))
+            surf.blit(s, (b.x[i] - offset[0], b.y[i] - offset[1]))
 
     def handle_event(self, event):
         pass
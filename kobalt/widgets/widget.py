@@ -1,7 +1,30 @@
 import pygame
 
+from .cache import LRUCache
+
 
 class Widget:
+    # compact instances: levels can hold thousands of plain widgets
+    __slots__ = (
+        "screen_size",
+        "_x",
+        "_y",
+        "_width",
+        "_height",
+        "_rect",
+        "prev_x",
+        "prev_y",
+        "_world",
+        "color",
+        "_image",
+        "_scaled_cache",
+        "_scaled_key",
+        "_scaled",
+    )
+
+    # how many scaled copies of the image each widget keeps around
+    SCALED_CACHE_SIZE = 8
+
     def __init__(
         self,
         screen_size=(1280, 720),
@@ -17,43 +40,99 @@ class Widget:
         self._y = y
         self._width = width
         self._height = height
+        # kept in sync by the setters, never rebuilt
+        self._rect = pygame.Rect(x, y, width, height)
+        # position at the previous simulation tick, used for interpolation
+        self.prev_x = x
+        self.prev_y = y
+        # collision world indexing this widget, notified when bounds change
+        self._world = None
         self.color = color
+        # scaled image cache, keyed by (width, height) and dropped whenever
+        # the image is replaced; created on first use
+        self._scaled_cache = None
+        self._scaled_key = None
+        self._scaled = None
         self.image = image
-        # position ratios
-        self.ratio_x = (self.x + self.width) / screen_size[0]
-        self.ratio_y = (self.y + self.height) / screen_size[1]
-
-    def draw(self, surface: pygame.Surface, dt):
-        self._update(dt)
 
+    def draw(self, surface: pygame.Surface, dt=None) -> pygame.Rect:
+        """Variable-step draw: update by dt (if given), then render."""
+        if dt is not None:
+            self.update(dt)
+        return self.render(surface)
+
+    def render(self, surface: pygame.Surface, alpha=1.0, offset=(0, 0)) -> pygame.Rect:
+        """
+        Draw without updating, interpolated between the last two ticks.
+        offset is subtracted from the position (a camera's view top-left).
+        Returns the area drawn, for dirty-rect rendering.
+        """
+        x, y = self.lerp_position(alpha)
+        x -= offset[0]
+        y -= offset[1]
         if self.image:
-            img = pygame.transform.scale(self.image, (self.width, self.height))
-            surface.blit(img, (self.x, self.y))
-        else:
-            pygame.draw.rect(surface, self.color, self.rect)
+            return surface.blit(self.get_scaled_image(), (x, y))
+        return pygame.draw.rect(surface, self.color, (x, y, self.width, self.height))
+
+    def update(self, dt):
+        """Advance the widget by one simulation step of dt seconds."""
+        self.prev_x = self._x
+        self.prev_y = self._y
+        self._update(dt)
 
     def _update(self, dt):
-        self.update_ratio_from_position()
+        pass
+
+    def lerp_position(self, alpha):
+        if alpha >= 1.0:
+            return self._x, self._y
+        return (
+            self.prev_x + (self._x - self.prev_x) * alpha,
+            self.prev_y + (self._y - self.prev_y) * alpha,
+        )
+
+    def snap_prev_position(self):
+        """Skip interpolation for teleports (wrapping, repositioning)."""
+        self.prev_x = self._x
+        self.prev_y = self._y
 
     def update_position(self, new_screen_size):
         old_rx, old_ry = self.ratio_x, self.ratio_y
         self.screen_size = new_screen_size
         self.x = int(old_rx * new_screen_size[0]) - self.width
         self.y = int(old_ry * new_screen_size[1]) - self.height
-        self.update_ratio_from_position()
+        self.snap_prev_position()
 
-    def update_ratio_from_position(self) -> None:
-        """Update internal screen ratio based on current position."""
-        self.ratio_x = (self.x + self.width) / self.screen_size[0]
-        self.ratio_y = (self.y + self.height) / self.screen_size[1]
+    @property
+    def image(self) -> pygame.Surface | None:
+        return self._image
+
+    @image.setter
+    def image(self, image):
+        # a new image invalidates every scaled copy, however it is assigned
+        self._image = image
+        self.clear_scaled_cache()
+
+    @property
+    def ratio_x(self) -> float:
+        """Screen ratio of the right edge, only computed when a resize needs it."""
+        return (self._x + self._width) / self.screen_size[0]
+
+    @property
+    def ratio_y(self) -> float:
+        """Screen ratio of the bottom edge."""
+        return (self._y + self._height) / self.screen_size[1]
 
     def set_position(self, x, y):
         self.x = x
         self.y = y
+        self.snap_prev_position()
 
     def set_size(self, width, height):
         self.width = width
         self.height = height
+        # previously scaled sizes stay cached, only the current one changes
+        self._scaled_key = None
 
     def set_color(self, color):
         self.color = color
@@ -61,6 +140,25 @@ class Widget:
     def set_image(self, image):
         self.image = image
 
+    def get_scaled_image(self) -> pygame.Surface:
+        """Return the image scaled to the widget size, scaling only on a cache miss."""
+        key = (self._width, self._height)
+        if key != self._scaled_key:
+            if self._scaled_cache is None:
+                self._scaled_cache = LRUCache(self.SCALED_CACHE_SIZE)
+            scaled = self._scaled_cache.get(key)
+            if scaled is None:
+                scaled = pygame.transform.scale(self.image, (self._width, self._height))
+                self._scaled_cache.put(key, scaled)
+            self._scaled_key = key
+            self._scaled = scaled
+        return self._scaled
+
+    def clear_scaled_cache(self):
+        self._scaled_cache = None
+        self._scaled_key = None
+        self._scaled = None
+
     @property
     def x(self):
         return self._x
@@ -68,7 +166,9 @@ class Widget:
     @x.setter
     def x(self, value):
         self._x = value
-        self.update_ratio_from_position()
+        self._rect.x = value
+        if self._world is not None:
+            self._world.mark_dirty(self)
 
     @property
     def y(self):
@@ -77,7 +177,9 @@ class Widget:
     @y.setter
     def y(self, value):
         self._y = value
-        self.update_ratio_from_position()
+        self._rect.y = value
+        if self._world is not None:
+            self._world.mark_dirty(self)
 
     @property
     def width(self):
@@ -86,7 +188,9 @@ class Widget:
     @width.setter
     def width(self, value):
         self._width = value
-        self.update_ratio_from_position()
+        self._rect.w = value
+        if self._world is not None:
+            self._world.mark_dirty(self)
 
     @property
     def height(self):
@@ -95,11 +199,14 @@ class Widget:
     @height.setter
     def height(self, value):
         self._height = value
-        self.update_ratio_from_position()
+        self._rect.h = value
+        if self._world is not None:
+            self._world.mark_dirty(self)
 
     @property
-    def rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+    def rect(self) -> pygame.Rect:
+        """Bounds as a cached Rect, updated in place; treat it as read-only."""
+        return self._rect
 
     def check_collision(self, other: "Widget"):
-        return self.rect.colliderect(other.rect)
+        return self._rect.colliderect(other._rect)
@@ -1,6 +1,37 @@
-from .pygame_window_controller import PygameWindowController
-from .window_controller import WindowController
 from .window_states import WindowStates
 
-__all__ = ["WindowStates", "WindowController", "PygameWindowController"]
+__all__ = [
+    "WindowStates",
+    "WindowController",
+    "PygameWindowController",
+    "MonitorCache",
+    "RenderTarget",
+    "SCREEN_CHANGED",
+    "normalize_mods",
+]
 __version__ = "0.1.0"
+
+# heavy submodules (pygame, screeninfo) load on first attribute access
+_LAZY = {
+    "WindowController": ".window_controller",
+    "PygameWindowController": ".pygame_window_controller",
+    "MonitorCache": ".monitor_cache",
+    "RenderTarget": ".render_target",
+    "SCREEN_CHANGED": ".pygame_window_controller",
+    "normalize_mods": ".keys",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
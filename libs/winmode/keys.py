@@ -0,0 +1,13 @@
+import pygame
+
+# left/right modifier variants collapse to one bit, lock keys are dropped
+MOD_GROUPS = (pygame.KMOD_CTRL, pygame.KMOD_SHIFT, pygame.KMOD_ALT, pygame.KMOD_META)
+
+
+def normalize_mods(mod: int) -> int:
+    """event.mod -> the CTRL/SHIFT/ALT/META bits held (either side)."""
+    mask = 0
+    for group in MOD_GROUPS:
+        if mod & group:
+            mask |= group
+    return mask
@@ -0,0 +1,68 @@
+from typing import Callable, List, Optional, Tuple
+
+Size = Tuple[int, int]
+
+
+def query_screeninfo() -> Tuple[List[Size], int]:
+    """Monitor sizes and the primary index from screeninfo (slow platform query)."""
+    # deferred: only needed when the cache is actually filled
+    from screeninfo import get_monitors
+
+    try:
+        monitors = get_monitors()
+    except Exception:
+        return [], 0
+    sizes = [(m.width, m.height) for m in monitors]
+    primary = next((i for i, m in enumerate(monitors) if m.is_primary), 0)
+    return sizes, primary
+
+
+class MonitorCache:
+    """
+    Monitor geometry, queried once and kept until invalidate() is called.
+    Falls back to the first monitor when none is marked primary, and to
+    `default_size` when no monitor is reported at all.
+    """
+
+    def __init__(
+        self,
+        query: Callable[[], Tuple[List[Size], int]] = query_screeninfo,
+        default_size: Optional[Size] = None,
+    ):
+        self.query = query
+        self.default_size = default_size
+        self._sizes: Optional[List[Size]] = None
+        self._primary = 0
+        self.queries = 0  # how often the platform was actually asked
+
+    def invalidate(self):
+        self._sizes = None
+
+    def refresh(self):
+        self._sizes, self._primary = self.query()
+        self.queries += 1
+
+    def get_sizes(self) -> List[Size]:
+        if self._sizes is None:
+            self.refresh()
+        return self._sizes
+
+    def get_primary_index(self) -> int:
+        self.get_sizes()
+        return self._primary
+
+    def get_size(self, display: Optional[int] = None) -> Size:
+        """Size of monitor `display`, or of the primary one when None."""
+        sizes = self.get_sizes()
+        if not sizes:
+            if self.default_size is None:
+                raise RuntimeError("no monitors reported and no default size set")
+            return self.default_size
+        index = self._primary if display is None else display
+        if not 0 <= index < len(sizes):
+            index = self._primary if 0 <= self._primary < len(sizes) else 0
+        return sizes[index]
+
+
+# shared cache behind WindowController.get_user_win_size
+monitor_cache = MonitorCache()
@@ -1,8 +1,12 @@
 import os
+import time
 from typing import Dict, List, Tuple
 
 import pygame
 
+from .keys import normalize_mods
+from .monitor_cache import MonitorCache, query_screeninfo
+from .render_target import RenderTarget
 from .window_controller import WindowController
 from .window_states import WindowStates
 
@@ -32,6 +36,29 @@ FLAGS_VALUES = [
 
 MODE_FLAG_MAP = dict(zip(WindowStates.all_states_w_none, FLAGS_VALUES))
 
+# events after which monitor geometry may have changed
+DISPLAY_CHANGE_EVENTS = frozenset(
+    getattr(pygame, name)
+    for name in ("VIDEORESIZE", "WINDOWDISPLAYCHANGED", "WINDOWMOVED")
+    if hasattr(pygame, name)
+)
+
+FULLSCREEN_ENV = {"SDL_VIDEO_CENTERED": "0", "SDL_VIDEO_WINDOW_POS": "0,0"}
+
+# posted once per applied display change (screen, window_size, mode)
+SCREEN_CHANGED = pygame.event.custom_type()
+
+
+def query_sdl_displays():
+    """Desktop sizes in SDL display order (matches the `display` arg)."""
+    try:
+        sizes = pygame.display.get_desktop_sizes()
+    except pygame.error:
+        sizes = []
+    if not sizes:
+        return query_screeninfo()
+    return [tuple(size) for size in sizes], 0
+
 
 class PygameWindowController(WindowController):
     def __init__(
@@ -44,6 +71,8 @@ class PygameWindowController(WindowController):
         vsync: int = 0,
         mode_sizes: dict = None,
         key_mode_map: KEY_MODE_TYPE = None,
+        render_target: RenderTarget = None,
+        min_interval: float = 0.25,
     ):
         super().__init__(mode, size, mode_sizes)
         self.flags = flags
@@ -51,68 +80,200 @@ class PygameWindowController(WindowController):
         self.display = display
         self.vsync = vsync
         self.key_mode_map = key_mode_map or DEFAULT_KEY_MODE_MAP.copy()
+        self.monitors = MonitorCache(query_sdl_displays, default_size=size)
+        # callback(screen) after every display surface (re)creation
+        self.screen_listeners = []
+        # fixed canvas scaled to the window; get_screen() returns the canvas
+        self.render_target = render_target
+        # requested changes wait for apply_pending(), at most one per frame
+        # and one per min_interval seconds; later requests replace earlier
+        self.min_interval = min_interval
+        self._pending_mode = None
+        self._pending_size = None
+        self._last_change = -min_interval
+        # an intermediate step was applied that listeners haven't heard of
+        self._unannounced = False
         self._screen = self._create_screen()
 
     def handle_event(self, event: pygame.event.Event) -> bool:
-        mode = self.get_mode_for_event(event)
-        if self.set_mode(mode):
+        """Queue the mode bound to event's keys; True if one was requested."""
+        self.handle_display_event(event)
+        return self.request_mode(self.get_mode_for_event(event))
+
+    def request_mode(self, mode: int) -> bool:
+        if mode is None:
+            return False
+        self._pending_mode = mode
+        return True
+
+    def request_size(self, width: int, height: int):
+        self._pending_size = (width, height)
+
+    def toggle_fullscreen(
+        self,
+        windowed: int = WindowStates.WINDOWED_STATELESS,
+        fullscreen: int = WindowStates.FULLSCREEN,
+    ) -> bool:
+        """Request the other of windowed/fullscreen (repeats coalesce)."""
+        target = self.get_target_mode()
+        return self.request_mode(
+            windowed if self.is_fullscreen_mode(target) else fullscreen
+        )
+
+    def get_target_mode(self) -> int:
+        """Mode after pending requests are applied (for toggles)."""
+        return self._pending_mode if self._pending_mode is not None else self.mode
+
+    @property
+    def has_pending(self) -> bool:
+        return self._pending_mode is not None or self._pending_size is not None
+
+    def apply_pending(self, now: float = None) -> bool:
+        """
+        Apply queued requests with at most one display change. Call once per
+        frame at a safe point (after events, before drawing). Returns True
+        once the requested screen is in place, after notifying listeners and
+        posting SCREEN_CHANGED; intermediate steps are not announced.
+        """
+        if not self.has_pending:
+            return False
+        now = time.perf_counter() if now is None else now
+        if now - self._last_change < self.min_interval:
+            return False
+
+        mode, size = self._pending_mode, self._pending_size
+        if mode == self.mode:
+            mode = self._pending_mode = None
+        if mode is None and (size is None or size == self.get_size()):
+            self._pending_size = None
+            if self._unannounced:
+                # the request changed to the intermediate mode itself
+                self._unannounced = False
+                self._screen_changed()
+                return True
+            return False
+
+        if (
+            mode is not None
+            and self.mode == WindowStates.FULLSCREEN
+            and mode not in WindowStates.fullscreen_states
+        ):
+            # leave exclusive fullscreen through WINDOWED_FULLSCREEN to avoid
+            # GUI bugs; the requested mode follows on a later frame
+            self._apply(WindowStates.WINDOWED_FULLSCREEN)
+            self._last_change = now
+            self._unannounced = True
+            return False
+        self._apply(mode, size)
+        self._pending_mode = self._pending_size = None
+        self._last_change = now
+        self._unannounced = False
+        self._screen_changed()
+        return True
+
+    def _apply(self, mode: int = None, size=None):
+        """One display change: optional new mode and windowed size."""
+        if mode is not None:
+            super().set_mode(mode)
+        if size is not None and self.mode not in WindowStates.fullscreen_states:
+            super().set_size(size)
+        # for fullscreen modes use monitor size
+        if self.mode in WindowStates.fullscreen_states:
+            super().set_mode_size(self.mode, self.get_monitor_size())
+        self._create_screen()
+
+    def handle_display_event(self, event: pygame.event.Event) -> bool:
+        """Drop cached monitor geometry when the display setup may have changed."""
+        if event.type in DISPLAY_CHANGE_EVENTS:
+            self.monitors.invalidate()
             return True
         return False
 
+    def get_monitor_size(self) -> tuple[int, int]:
+        """Size of the monitor this window is on (`display`)."""
+        return self.monitors.get_size(self.display)
+
     def mode_to_flag(self) -> int:
         return MODE_FLAG_MAP.get(self.mode, 0)
 
     def get_flag(self) -> int:
         return self.flags | self.mode_to_flag()
 
-    def get_mode_for_event(self, event: pygame.event.Event) -> int | None:
-        key = event.key if hasattr(event, "key") else None
-        mods = event.mod if hasattr(event, "mod") else 0
-
-        # Try exact match first
-        result = self.key_mode_map.get((mods, key))
-        if result is not None:
-            return result
+    @property
+    def key_mode_map(self) -> KEY_MODE_TYPE:
+        return self._key_mode_map
 
-        # Try with just the CTRL bit
-        if mods & pygame.KMOD_CTRL:
-            result = self.key_mode_map.get((pygame.KMOD_CTRL, key))
-            if result is not None:
-                return result
+    @key_mode_map.setter
+    def key_mode_map(self, key_mode_map: KEY_MODE_TYPE):
+        # assign a new map to rebind: lookups go through the normalized copy
+        self._key_mode_map = key_mode_map
+        self._mode_table = {
+            (normalize_mods(mods), key): mode
+            for (mods, key), mode in key_mode_map.items()
+        }
 
-        # Fallback to no modifier
-        return self.key_mode_map.get((0, key))
+    def get_mode_for_event(self, event: pygame.event.Event) -> int | None:
+        if event.type != pygame.KEYDOWN:
+            return None
+        # held modifiers (either side, lock keys ignored), then none
+        table = self._mode_table
+        mode = table.get((normalize_mods(event.mod), event.key))
+        if mode is None:
+            mode = table.get((0, event.key))
+        return mode
 
     def get_screen(self) -> pygame.Surface:
+        """Surface to draw on: the render target's canvas if there is one."""
+        if self.render_target is not None:
+            return self.render_target.canvas
         return self._screen
 
+    def get_window(self) -> pygame.Surface:
+        """The display surface itself."""
+        return self._screen
+
+    def present(self, rects=None):
+        """Show the frame; rects limits the update to those screen areas."""
+        if self.render_target is not None:
+            self.render_target.present(self._screen, rects)
+        elif rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    def to_screen_pos(self, pos):
+        """Window position (mouse events) -> get_screen() position."""
+        if self.render_target is not None:
+            return self.render_target.to_canvas(pos)
+        return pos
+
     def set_size(self, width: int, height: int):
         super().set_size((width, height))
         self._create_screen()
+        self._screen_changed()
 
     def set_mode(self, mode: int) -> bool:
-        prev_mode = self.get_mode()
-        if mode is not None and mode != prev_mode:
-            # if leaving fullscreen, go to WINDOWED_FULLSCREEN first to avoid GUI bugs
-            if (
-                prev_mode == WindowStates.FULLSCREEN
-                and not mode in WindowStates.fullscreen_states
-            ):
-                super().set_mode(WindowStates.WINDOWED_FULLSCREEN)
-                super().set_mode_size(
-                    WindowStates.WINDOWED_FULLSCREEN,
-                    WindowController.get_user_win_size(),
-                )
-                self._create_screen()
-                pygame.event.pump()
-            super().set_mode(mode)
+        """
+        Switch right away with a single display change; prefer request_mode
+        in a game loop, which also steps out of exclusive fullscreen through
+        WINDOWED_FULLSCREEN over two frames.
+        """
+        if mode is None or mode == self.get_mode():
+            return False  # mode was not changed
+        self._apply(mode)
+        self._unannounced = False
+        self._screen_changed()
+        return True  # mode was changed
+
+    def add_screen_listener(self, callback):
+        """Call callback(screen) once after every display change, e.g. to
+        convert cached surfaces to the new pixel format."""
+        self.screen_listeners.append(callback)
+        return callback
 
-            # for fullscreen modes use monitor size
-            if mode in WindowStates.fullscreen_states:
-                super().set_mode_size(mode, WindowController.get_user_win_size())
-            self._create_screen()
-            return True  # mode was changed
-        return False  # mode was not changed
+    def remove_screen_listener(self, callback):
+        if callback in self.screen_listeners:
+            self.screen_listeners.remove(callback)
 
     def set_screen(self, new_screen):
         self._screen = new_screen
@@ -121,17 +282,33 @@ class PygameWindowController(WindowController):
         size = self.get_size()
         if self.mode in WindowStates.fullscreen_states:
             # force fullscreen window at (0, 0)
-            os.environ["SDL_VIDEO_CENTERED"] = "0"
-            os.environ["SDL_VIDEO_WINDOW_POS"] = "0,0"
-            size = WindowController.get_user_win_size()
+            for key, value in FULLSCREEN_ENV.items():
+                if os.environ.get(key) != value:
+                    os.environ[key] = value
+            size = self.get_monitor_size()
 
         flags = self.flags | self.mode_to_flag()
         screen = pygame.display.set_mode(
             size, flags, self.depth, self.display, self.vsync
         )
         self._screen = screen
+        if self.render_target is not None:
+            self.render_target.attach(screen)
         return screen
 
+    def _screen_changed(self):
+        screen = self.get_screen()
+        for callback in self.screen_listeners:
+            callback(screen)
+        pygame.event.post(
+            pygame.event.Event(
+                SCREEN_CHANGED,
+                screen=screen,
+                window_size=self._screen.get_size(),
+                mode=self.mode,
+            )
+        )
+
     @staticmethod
     def custom_key_mode_map_builder(
         keys: List[int],
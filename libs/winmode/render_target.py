@@ -0,0 +1,183 @@
+import math
+from fractions import Fraction
+from typing import Iterable, Optional, Tuple
+
+import pygame
+
+# integer: largest whole multiple that fits, pixel exact
+# fit: nearest-neighbour to the largest aspect-correct size
+# smooth: smoothscale to the largest aspect-correct size
+SCALE_MODES = ("integer", "fit", "smooth")
+
+
+class RenderTarget:
+    """
+    Fixed-size canvas the game draws to, scaled to the window on present().
+
+    Draw cost depends only on the canvas size, never on the monitor: a 4K
+    fullscreen window costs the same fills and blits as 1280x720, plus one
+    scale. The canvas survives mode switches, so nothing drawn in canvas
+    coordinates needs repositioning.
+
+    Dirty rects are snapped to the grid of canvas pixels that land on whole
+    window pixels, so partial presents sample exactly like a full one: no
+    seams or overlaps between neighbouring rects at fractional scales.
+
+    render_scale < 1 presents the canvas through a smaller image (a cheaper,
+    blockier look); the canvas keeps its logical size, so draw code is
+    unaffected. Partial presents are skipped at reduced scales.
+    """
+
+    def __init__(
+        self,
+        logical_size: Tuple[int, int],
+        scale_mode: str = "integer",
+        render_scale: float = 1.0,
+        border=(0, 0, 0),
+    ):
+        if scale_mode not in SCALE_MODES:
+            raise ValueError(f"scale_mode must be one of {SCALE_MODES}")
+        if not 0 < render_scale <= 1:
+            raise ValueError("render_scale must be in (0, 1]")
+        self.logical_size = tuple(logical_size)
+        self.size = self.logical_size
+        self.scale_mode = scale_mode
+        self.render_scale = render_scale
+        self.border = border
+        w, h = self.size
+        self.canvas = pygame.Surface(self.size)
+        # reduced-resolution image the canvas is shown through, if any
+        self.render_size = (
+            max(1, round(w * render_scale)),
+            max(1, round(h * render_scale)),
+        )
+        self._low = None
+        if self.render_size != self.size:
+            self._low = pygame.Surface(self.render_size)
+        self.dest = pygame.Rect((0, 0), self.size)  # canvas area in the window
+        self.scale = 1.0
+        self._grid = (1, 1)  # canvas pixels per whole-window-pixel step
+        self._full = True
+
+    def layout(self, window_size) -> pygame.Rect:
+        """Where the scaled canvas goes in a window of window_size (centred)."""
+        ww, wh = window_size
+        cw, ch = self.size
+        scale = min(ww / cw, wh / ch)
+        if self.scale_mode == "integer":
+            # below 1x there is no whole multiple, shrink like fit instead
+            scale = max(1, math.floor(scale)) if scale >= 1 else scale
+        w, h = max(1, round(cw * scale)), max(1, round(ch * scale))
+        return pygame.Rect((ww - w) // 2, (wh - h) // 2, w, h)
+
+    def attach(self, window: pygame.Surface):
+        """Adopt a (new) window surface: relayout, match its pixel format."""
+        self.dest = self.layout(window.get_size())
+        self.scale = self.dest.w / self.size[0]
+        self._grid = (
+            Fraction(self.dest.w, self.size[0]).denominator,
+            Fraction(self.dest.h, self.size[1]).denominator,
+        )
+        if self._low is not None:
+            self._low = pygame.Surface(self.render_size, 0, window)
+        canvas = pygame.Surface(self.size, 0, window)
+        old = self.canvas
+        if (canvas.get_bitsize(), canvas.get_masks()) != (
+            old.get_bitsize(),
+            old.get_masks(),
+        ):
+            canvas.blit(old, (0, 0))
+            self.canvas = canvas
+        window.fill(self.border)
+        self._full = True
+
+    def present(self, window: pygame.Surface, rects: Optional[Iterable] = None):
+        """
+        Scale the canvas (or only rects of it) into the window and push it to
+        the display. rects=None presents the whole canvas.
+        """
+        dest = self.dest
+        # smoothscale blends across rect edges, so it always scales everything
+        partial = (
+            rects is not None
+            and not self._full
+            and self.scale_mode != "smooth"
+            and self._low is None
+        )
+        if partial:
+            rects = self._snap_rects(rects)
+            partial = rects is not None
+        if not partial:
+            source = self.canvas
+            if self._low is not None:
+                self._scale(source, self._low)
+                source = self._low
+            self._scale(source, window.subsurface(dest))
+            if self._full:
+                pygame.display.flip()  # borders too
+            else:
+                pygame.display.update(dest)
+            self._full = False
+            return
+
+        updated = []
+        for rect in rects:
+            out = self.to_window_rect(rect)
+            if not out.w or not out.h:
+                continue
+            pygame.transform.scale(
+                self.canvas.subsurface(rect), out.size, window.subsurface(out)
+            )
+            updated.append(out)
+        pygame.display.update(updated)
+
+    def _snap_rects(self, rects) -> Optional[list]:
+        """
+        Clip rects to the canvas and grow them to the scaled grid; None when
+        they would cover the whole canvas anyway.
+        """
+        bounds = self.canvas.get_rect()
+        gx, gy = self._grid
+        snapped = []
+        area = 0
+        for rect in rects:
+            rect = pygame.Rect(rect).clip(bounds)
+            if not rect.w or not rect.h:
+                continue
+            left = rect.left - rect.left % gx
+            top = rect.top - rect.top % gy
+            right = min(-(-rect.right // gx) * gx, bounds.w)
+            bottom = min(-(-rect.bottom // gy) * gy, bounds.h)
+            rect = pygame.Rect(left, top, right - left, bottom - top)
+            snapped.append(rect)
+            area += rect.w * rect.h
+        if area >= bounds.w * bounds.h:
+            return None
+        return snapped
+
+    def _scale(self, source, target):
+        if target.get_size() == source.get_size():
+            target.blit(source, (0, 0))
+        elif self.scale_mode == "smooth":
+            pygame.transform.smoothscale(source, target.get_size(), target)
+        else:
+            pygame.transform.scale(source, target.get_size(), target)
+
+    def to_window_rect(self, rect) -> pygame.Rect:
+        """Canvas rect -> the window rect it covers (rounded outwards)."""
+        rect = pygame.Rect(rect)
+        cw, ch = self.size
+        dest = self.dest
+        # integer maths: grid-aligned edges land exactly on window pixels
+        x0 = dest.x + rect.left * dest.w // cw
+        y0 = dest.y + rect.top * dest.h // ch
+        x1 = dest.x - (-rect.right * dest.w // cw)
+        y1 = dest.y - (-rect.bottom * dest.h // ch)
+        return pygame.Rect(x0, y0, x1 - x0, y1 - y0).clip(self.dest)
+
+    def to_canvas(self, pos) -> Tuple[float, float]:
+        """Window position (e.g. the mouse) -> canvas position."""
+        return (
+            (pos[0] - self.dest.x) / self.scale,
+            (pos[1] - self.dest.y) / self.scale,
+        )
@@ -1,7 +1,6 @@
-from typing import Dict, Tuple
-
-from screeninfo import get_monitors
+from typing import Dict, Optional, Tuple
 
+from .monitor_cache import monitor_cache
 from .window_states import WindowStates
 
 
@@ -59,6 +58,6 @@ class WindowController:
         return mode in WindowStates.fullscreen_states
 
     @staticmethod
-    def get_user_win_size() -> Tuple[int, int]:
-        primary = next((m for m in get_monitors() if m.is_primary), None)
-        return (primary.width, primary.height)
+    def get_user_win_size(display: Optional[int] = None) -> Tuple[int, int]:
+        """Monitor size (primary when display is None), cached after the first call."""
+        return monitor_cache.get_size(display)
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# entry points import `engine`, `widgets` and `libs.winmode` from these roots
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path[:0] = [os.path.join(ROOT, "kobalt"), ROOT]
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
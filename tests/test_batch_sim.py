@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from analysis.batch_sim import batch_simulate
+from engine import FixedTimestep, ReplayInput
+from engine.input import ACTION_BITS
+from widgets import Player
+
+LEFT, RIGHT, JUMP = ACTION_BITS["left"], ACTION_BITS["right"], ACTION_BITS["jump"]
+
+# run right, hop, strafe in the air, reverse, idle, mash both directions
+FRAMES = (
+    [RIGHT] * 60
+    + [RIGHT | JUMP]
+    + [RIGHT] * 40
+    + ([RIGHT | JUMP] + [RIGHT] * 29) * 4
+    + [LEFT | JUMP]
+    + [LEFT] * 90
+    + [0] * 45
+    + [LEFT | RIGHT] * 20
+    + ([JUMP] + [0] * 14) * 3
+    + [LEFT] * 300
+)
+
+PARAMS = (
+    "speed",
+    "jump_height",
+    "gravity",
+    "air_strafe",
+    "air_strafe_grow",
+    "air_strafe_decay",
+    "max_speed",
+    "air_strafe_ground_threshold_ms",
+)
+
+
+def run_player(**kwargs):
+    player = Player(
+        screen_size=(1280, 720),
+        x=40,
+        y=720 - 40,
+        width=40,
+        height=40,
+        input_source=ReplayInput(FRAMES),
+        **kwargs,
+    )
+    params = {name: getattr(player, name) for name in PARAMS}
+    params["speed"] = player.old_speed
+    engine = FixedTimestep(60)
+    engine.add(player)
+    rows = []
+    for _ in FRAMES:
+        engine.tick()
+        rows.append((player.speed, player.x, player.y))
+    return params, np.asarray(rows)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"air_strafe": False},
+        {"speed": 7, "max_speed": 30, "air_strafe_decay": 0.95},
+        {"air_strafe_grow": 0.3, "air_strafe_ground_threshold_ms": 40},
+        {"gravity": 0.9, "jump_height": 14},
+    ],
+)
+def test_batch_matches_player(kwargs):
+    params, expected = run_player(**kwargs)
+    result = batch_simulate(FRAMES, n=1, dtype=np.float64, **params)
+    for i, name in enumerate(("speed", "x", "y")):
+        np.testing.assert_allclose(result[name][:, 0], expected[:, i], atol=1e-9)
+
+
+def test_batch_players_are_independent():
+    # one run of several parameter sets equals each set run on its own
+    cases = [{}, {"speed": 7, "max_speed": 30}, {"gravity": 0.9}]
+    runs = [run_player(**kwargs) for kwargs in cases]
+    params = {name: [p[name] for p, _ in runs] for name in PARAMS}
+    result = batch_simulate(FRAMES, n=len(cases), dtype=np.float64, **params)
+    for j, (_, expected) in enumerate(runs):
+        np.testing.assert_allclose(result["x"][:, j], expected[:, 1], atol=1e-9)
@@ -0,0 +1,100 @@
+import pygame
+import pytest
+from engine import ANY_MODS, Bindings, Dispatcher
+
+
+def key(key, mod=0, type=pygame.KEYDOWN):
+    return pygame.event.Event(type, key=key, mod=mod)
+
+
+@pytest.fixture
+def bindings():
+    return Bindings({"jump": [pygame.K_SPACE], "quit": [pygame.K_ESCAPE]})
+
+
+def test_default_bindings():
+    bindings = Bindings()
+    assert bindings.actions_for(key(pygame.K_a)) == ("left",)
+    assert bindings.actions_for(key(pygame.K_F11)) == ("fullscreen",)
+
+
+def test_rebind_replaces_keys(bindings):
+    version = bindings.version
+    bindings.rebind("jump", pygame.K_w, pygame.K_UP)
+    assert bindings.keys_for("jump") == [pygame.K_w, pygame.K_UP]
+    assert bindings.actions_for(key(pygame.K_SPACE)) == ()
+    assert bindings.actions_for(key(pygame.K_UP)) == ("jump",)
+    assert bindings.version > version
+
+
+def test_unbind_key_and_action(bindings):
+    bindings.bind("jump", pygame.K_UP)
+    bindings.unbind("jump", pygame.K_SPACE)
+    assert bindings.keys_for("jump") == [pygame.K_UP]
+    bindings.unbind("jump")
+    assert "jump" not in bindings
+    assert bindings.actions_for(key(pygame.K_UP)) == ()
+
+
+def test_any_mods_matches_with_modifiers_held(bindings):
+    assert bindings.actions_for(key(pygame.K_SPACE, pygame.KMOD_LSHIFT)) == (
+        "jump",
+    )
+    # lock keys never get in the way
+    assert bindings.actions_for(key(pygame.K_ESCAPE, pygame.KMOD_NUM)) == ("quit",)
+
+
+def test_exact_mods_only_match_those_mods(bindings):
+    bindings.bind("save", pygame.K_s, pygame.KMOD_CTRL)
+    assert bindings.actions_for(key(pygame.K_s, pygame.KMOD_LCTRL)) == ("save",)
+    assert bindings.actions_for(key(pygame.K_s, pygame.KMOD_RCTRL)) == ("save",)
+    assert bindings.actions_for(key(pygame.K_s)) == ()
+    ctrl_shift = pygame.KMOD_LCTRL | pygame.KMOD_LSHIFT
+    assert bindings.actions_for(key(pygame.K_s, ctrl_shift)) == ()
+
+
+def test_exact_mods_come_before_any_mods(bindings):
+    bindings.bind("fast_jump", pygame.K_SPACE, pygame.KMOD_SHIFT)
+    shifted = key(pygame.K_SPACE, pygame.KMOD_LSHIFT)
+    assert bindings.actions_for(shifted) == ("fast_jump", "jump")
+    assert bindings.actions_for(key(pygame.K_SPACE)) == ("jump",)
+
+
+def test_keyup_and_non_key_events_are_ignored(bindings):
+    assert bindings.actions_for(key(pygame.K_SPACE, type=pygame.KEYUP)) == ()
+    assert bindings.actions_for(pygame.event.Event(pygame.QUIT)) == ()
+
+
+def test_bind_tuple_and_any_mods_constant(bindings):
+    bindings.bind("save", (pygame.K_s, pygame.KMOD_CTRL))
+    bindings.bind("menu", pygame.K_m, ANY_MODS)
+    assert bindings.actions_for(key(pygame.K_s, pygame.KMOD_CTRL)) == ("save",)
+    assert bindings.actions_for(key(pygame.K_m, pygame.KMOD_ALT)) == ("menu",)
+
+
+def test_dispatcher_routes_by_type_action_and_any(bindings):
+    dispatcher = Dispatcher(bindings)
+    calls = []
+    dispatcher.on_event(pygame.QUIT, lambda event: calls.append("type"))
+    dispatcher.on_action("jump", lambda event: calls.append("jump"))
+    dispatcher.on_any(lambda event: calls.append("any"))
+
+    count = dispatcher.process(
+        [
+            key(pygame.K_SPACE),
+            key(pygame.K_SPACE, type=pygame.KEYUP),
+            pygame.event.Event(pygame.QUIT),
+        ]
+    )
+    assert count == 3
+    assert calls == ["any", "jump", "any", "any", "type"]
+
+
+def test_dispatcher_follows_rebinding(bindings):
+    dispatcher = Dispatcher(bindings)
+    calls = []
+    dispatcher.on_action("jump", calls.append)
+    bindings.rebind("jump", pygame.K_w)
+    assert not dispatcher.dispatch(key(pygame.K_SPACE))
+    assert dispatcher.dispatch(key(pygame.K_w))
+    assert len(calls) == 1
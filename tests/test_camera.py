@@ -0,0 +1,39 @@
+from engine import Camera, CollisionWorld
+from widgets import Widget
+
+
+def make_widget(x, y):
+    widget = Widget((10_000, 1000), x, y, 20, 20)
+    widget.snap_prev_position()
+    return widget
+
+
+def test_visible_with_world_only_returns_widgets_near_the_view():
+    world = CollisionWorld()
+    near = make_widget(100, 100)
+    far = [make_widget(2000 + i * 50, 100) for i in range(100)]
+    world.add(near, *far)
+    camera = Camera((640, 360), world=world)
+    assert camera.visible() == [near]
+    assert camera.visible({near}) == [near]
+    assert camera.visible(set(far)) == []
+
+
+def test_visible_without_world_scans_widgets():
+    near, far = make_widget(100, 100), make_widget(2000, 100)
+    camera = Camera((640, 360))
+    assert camera.visible([near, far]) == [near]
+
+
+def test_fast_movers_are_culled_at_their_interpolated_position():
+    world = CollisionWorld()
+    mover = make_widget(630, 100)
+    world.add(mover)
+    # one tick moved it out of the view; half way through it is still inside
+    mover.prev_x = mover.x
+    mover.x = 700
+    camera = Camera((640, 360), world=world)
+    assert camera.visible(alpha=0.0) == [mover]
+    assert camera.visible(alpha=1.0) == []
+    assert camera.visible([mover], alpha=0.0) == [mover]
+    assert Camera((640, 360)).visible([mover], alpha=0.0) == [mover]
@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from kobalt.analysis import plot_speed
+
+
+def test_decimate_keeps_spikes():
+    values = np.zeros(100_000)
+    values[12_345] = 50.0
+    values[67_890] = -3.0
+    indices, kept = plot_speed.decimate_minmax(values, max_points=200)
+    assert len(kept) <= 200
+    assert kept.max() == 50.0 and kept.min() == -3.0
+    assert np.all(np.diff(indices) >= 0)  # original order
+
+
+@pytest.mark.parametrize("package", [True, False])
+def test_load_recording(tmp_path, package, monkeypatch):
+    from engine import TelemetryRecorder
+
+    recorder = TelemetryRecorder(str(tmp_path / "run"), fields={"speed": "f8"})
+    for speed in (1.0, 2.5, 4.0):
+        recorder.sample(SimpleNamespace(speed=speed))
+    recorder.close()
+
+    if package:
+        load = plot_speed._load_recording
+    else:
+        # the entry points import it as a top-level analysis module
+        from analysis import plot_speed as module
+
+        load = module._load_recording
+    assert list(load(str(tmp_path / "run"))["speed"]) == [1.0, 2.5, 4.0]
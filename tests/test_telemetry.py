@@ -0,0 +1,37 @@
+import time
+from types import SimpleNamespace
+
+from engine import TelemetryRecorder, load_telemetry
+
+
+def wait_for(path, count, timeout=2.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        speeds = load_telemetry(path, mmap=False)["speed"]
+        if len(speeds) >= count:
+            return speeds
+        time.sleep(0.01)
+    return load_telemetry(path, mmap=False)["speed"]
+
+
+def test_flush_every_writes_partial_chunks(tmp_path):
+    path = str(tmp_path / "run")
+    recorder = TelemetryRecorder(path, fields={"speed": "f8"}, flush_every=10)
+    for i in range(25):
+        recorder.sample(SimpleNamespace(speed=float(i)))
+    # on disk before close(), well short of a full chunk
+    assert list(wait_for(path, 20)) == [float(i) for i in range(20)]
+    recorder.close()
+    assert len(load_telemetry(path)["speed"]) == 25
+
+
+def test_close_on_error_keeps_partial_chunk(tmp_path):
+    path = str(tmp_path / "run")
+    try:
+        with TelemetryRecorder(path, fields={"speed": "f8"}) as recorder:
+            for i in range(5):
+                recorder.sample(SimpleNamespace(speed=float(i)))
+            raise RuntimeError("game loop crashed")
+    except RuntimeError:
+        pass
+    assert list(load_telemetry(path)["speed"]) == [0.0, 1.0, 2.0, 3.0, 4.0]
@@ -0,0 +1,30 @@
+import pygame
+import pytest
+from widgets import Trail
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0]
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: now[0])
+    return now
+
+
+@pytest.mark.parametrize("batched", [True, False])
+def test_old_tracks_never_fade_below_min_alpha(clock, batched):
+    trail = Trail(
+        (100, 100),
+        color=(255, 255, 255),
+        width=4,
+        height=4,
+        lifetime=1000,
+        min_alpha=10,
+        alpha_step=16,
+        batched=batched,
+    )
+    trail.draw(pygame.Surface((100, 100)), 10, 10)
+    clock[0] = 990
+    surface = pygame.Surface((100, 100))
+    trail.draw(surface, 80, 80)
+    oldest = max(surface.get_at((x, y)).r for x in range(5, 15) for y in range(5, 15))
+    assert oldest >= 9  # min_alpha over black, give or take blending rounding
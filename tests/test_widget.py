@@ -0,0 +1,23 @@
+import pygame
+from widgets import Widget
+
+
+def test_scaled_image_follows_direct_assignment():
+    red = pygame.Surface((4, 4))
+    red.fill((255, 0, 0))
+    widget = Widget((100, 100), width=8, height=8, image=red)
+    assert widget.get_scaled_image().get_at((0, 0))[:3] == (255, 0, 0)
+
+    blue = pygame.Surface((4, 4))
+    blue.fill((0, 0, 255))
+    widget.image = blue
+    assert widget.get_scaled_image().get_at((0, 0))[:3] == (0, 0, 255)
+
+
+def test_scaled_sizes_are_cached():
+    widget = Widget((100, 100), width=8, height=8, image=pygame.Surface((4, 4)))
+    first = widget.get_scaled_image()
+    widget.set_size(16, 16)
+    assert widget.get_scaled_image().get_size() == (16, 16)
+    widget.set_size(8, 8)
+    assert widget.get_scaled_image() is first
@@ -0,0 +1,53 @@
+import pygame
+import pytest
+
+from libs.winmode import PygameWindowController, WindowStates
+
+
+@pytest.fixture
+def controller():
+    pygame.init()
+    controller = PygameWindowController((640, 360), min_interval=0.25)
+    controller.changes = []
+    controller.add_screen_listener(lambda screen: controller.changes.append(screen))
+    yield controller
+    pygame.quit()
+
+
+def test_requests_coalesce_into_one_change(controller):
+    controller.request_mode(WindowStates.WINDOWED_FULLSCREEN)
+    controller.request_mode(WindowStates.BORDERLESS)
+    assert controller.apply_pending(now=10.0)
+    assert controller.mode == WindowStates.BORDERLESS
+    assert len(controller.changes) == 1
+    assert not controller.apply_pending(now=11.0)
+
+
+def test_changes_are_debounced(controller):
+    controller.request_mode(WindowStates.BORDERLESS)
+    assert controller.apply_pending(now=10.0)
+    controller.request_mode(WindowStates.WINDOWED_STATELESS)
+    assert not controller.apply_pending(now=10.1)
+    assert controller.apply_pending(now=10.5)
+    assert len(controller.changes) == 2
+
+
+def test_leaving_fullscreen_announces_only_the_final_mode(controller):
+    controller.set_mode(WindowStates.FULLSCREEN)
+    del controller.changes[:]
+    controller.request_mode(WindowStates.WINDOWED_STATELESS)
+    # first step goes through WINDOWED_FULLSCREEN, silently
+    assert not controller.apply_pending(now=10.0)
+    assert controller.mode == WindowStates.WINDOWED_FULLSCREEN
+    assert controller.changes == []
+    assert controller.apply_pending(now=11.0)
+    assert controller.mode == WindowStates.WINDOWED_STATELESS
+    assert len(controller.changes) == 1
+
+
+def test_set_mode_is_one_change(controller):
+    controller.set_mode(WindowStates.FULLSCREEN)
+    controller.set_mode(WindowStates.WINDOWED_STATELESS)
+    assert controller.mode == WindowStates.WINDOWED_STATELESS
+    assert len(controller.changes) == 2
+    assert not controller.set_mode(WindowStates.WINDOWED_STATELESS)